@@ -6,10 +6,10 @@ Uses trustcall for efficient JSON patch-based extraction.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, TypedDict, Annotated, Type
-from datetime import datetime
+import threading
+from typing import Dict, Any, List, Optional, TypedDict, Annotated, Type, AsyncIterator
 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
@@ -21,17 +21,33 @@ from trustcall import create_extractor
 from app.core.config import settings
 from app.models.form_config import FormConfig
 from app.services.llm import create_llm
+from app.services.semantic_cache import get_semantic_cache
 from .prompt_generator import generate_system_prompt, generate_greeting
+from .prompts import TIME_PROMPT, get_prompt_time
 from .schema_generator import generate_extraction_schema, create_empty_payload
 
 logger = logging.getLogger(__name__)
 
+# Instruction appended to the conversation when predicting the next turn
+PREFETCH_INSTRUCTION = (
+    "Predict the user's most likely reply to your last message, and the "
+    "response you would give to that reply. Keep the reply short and "
+    "phrased the way the user would say it."
+)
+
+
+class PredictedTurn(BaseModel):
+    """A predicted next user reply and the agent's response to it."""
+    reply: str
+    response: str
+
 
 class AgentState(TypedDict):
     """State for the dynamic agent graph."""
     messages: Annotated[List[BaseMessage], add_messages]
     payload: Dict[str, Any]
     is_form_complete: bool
+    extracted: bool  # whether the last extraction ran and returned data
     form_config_id: str
     
     # Cost tracking
@@ -67,16 +83,21 @@ class DynamicAgent:
         # Initialize LLM
         self.llm = create_llm()
         
-        # Generate system prompt from config
+        # Generate system prompt from config; the time goes in its own
+        # message so the static prompt prefix can be cached by the provider
         system_prompt = generate_system_prompt(form_config)
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
+            ("system", TIME_PROMPT),
             ("placeholder", "{messages}"),
         ])
         
         # Create the runnable chain
         self.chain = self.prompt | self.llm
         
+        # Chain for predicting the next turn ahead of time
+        self.prefetch_chain = self.prompt | self.llm.with_structured_output(PredictedTurn)
+        
         # Generate dynamic extraction schema
         self.extraction_schema = generate_extraction_schema(form_config)
         
@@ -146,7 +167,7 @@ class DynamicAgent:
         # Prepare input for the chain
         chain_input = {
             "messages": messages,
-            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "time": get_prompt_time()
         }
         
         # Get response from LLM
@@ -193,7 +214,7 @@ class DynamicAgent:
             if result.get("responses"):
                 extracted = result["responses"][0]
                 # Convert Pydantic model to dict if needed
-                if hasattr(extracted, "model_dump"):
+                if isinstance(extracted, BaseModel):
                     extracted_dict = extracted.model_dump()
                 else:
                     extracted_dict = dict(extracted)
@@ -216,33 +237,25 @@ class DynamicAgent:
             
             return {
                 "payload": updated_payload,
-                "is_form_complete": is_complete
+                "is_form_complete": is_complete,
+                "extracted": bool(result.get("responses")),
             }
             
         except Exception as e:
             logger.error(f"Extraction error: {e}")
             return {
                 "payload": payload_before,
-                "is_form_complete": False
+                "is_form_complete": False,
+                "extracted": False,
             }
     
-    async def process_message(
+    def _prepare_run(
         self,
         message: str,
         thread_id: str,
-        is_conversation_start: bool = False,
-    ) -> Dict[str, Any]:
-        """
-        Process a user message and get agent response.
-        
-        Args:
-            message: User message text
-            thread_id: Conversation thread ID
-            is_conversation_start: Whether this starts a new conversation
-            
-        Returns:
-            Dict with response, payload, and completion status
-        """
+        is_conversation_start: bool,
+    ) -> tuple[AgentState, RunnableConfig]:
+        """Build the initial graph state and run config for a turn."""
         # Prepare input message
         if is_conversation_start:
             input_message = HumanMessage(content="[CONVERSATION_START]")
@@ -254,6 +267,7 @@ class DynamicAgent:
             "messages": [input_message],
             "payload": create_empty_payload(self.form_config),
             "is_form_complete": False,
+            "extracted": False,
             "form_config_id": self.form_config.id,
             "input_tokens": 0,
             "output_tokens": 0,
@@ -266,32 +280,214 @@ class DynamicAgent:
             "configurable": {"thread_id": thread_id}
         }
         
+        return initial_state, config
+    
+    @staticmethod
+    def _response_from_state(state: Dict[str, Any]) -> str:
+        """Get the latest assistant response text from a graph state."""
+        if "messages" in state and state["messages"]:
+            last_message = state["messages"][-1]
+            if hasattr(last_message, 'content') and last_message.content:
+                if last_message.content != "[CONVERSATION_START]":
+                    return last_message.content
+        return ""
+    
+    async def process_message(
+        self,
+        message: str,
+        thread_id: str,
+        is_conversation_start: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Process a user message and get agent response.
+        
+        Args:
+            message: User message text
+            thread_id: Conversation thread ID
+            is_conversation_start: Whether this starts a new conversation
+            
+        Returns:
+            Dict with response, payload (always a plain dict), completion
+            status, and whether extraction succeeded
+        """
+        initial_state, config = self._prepare_run(message, thread_id, is_conversation_start)
+        
         # Process through graph
         response_text = ""
         final_state = None
         
         async for event in self.graph.astream(initial_state, config, stream_mode="values"):
             final_state = event
-            if "messages" in event and event["messages"]:
-                last_message = event["messages"][-1]
-                if hasattr(last_message, 'content') and last_message.content:
-                    if last_message.content != "[CONVERSATION_START]":
-                        response_text = last_message.content
+            response_text = self._response_from_state(event) or response_text
         
-        # Get final payload
+        # Get final payload; the extractor always stores it as a dict
         payload = final_state.get("payload", {}) if final_state else {}
         is_complete = final_state.get("is_form_complete", False) if final_state else False
+        extracted = final_state.get("extracted", False) if final_state else False
         
         return {
             "response": response_text,
             "payload": payload,
             "is_form_complete": is_complete,
+            "extracted": extracted,
+        }
+    
+    async def astream_message(
+        self,
+        message: str,
+        thread_id: str,
+        is_conversation_start: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message, streaming the response as it is generated.
+        
+        Yields ``{"delta": str}`` events with response tokens from the agent
+        node, followed by a single final event with the same shape as
+        ``process_message``'s return value.
+        
+        Args:
+            message: User message text
+            thread_id: Conversation thread ID
+            is_conversation_start: Whether this starts a new conversation
+        """
+        initial_state, config = self._prepare_run(message, thread_id, is_conversation_start)
+        
+        streamed_text = ""
+        response_text = ""
+        final_state = None
+        
+        async for mode, chunk in self.graph.astream(
+            initial_state, config, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                final_state = chunk
+                response_text = self._response_from_state(chunk) or response_text
+                continue
+            
+            # Only forward tokens from the conversational node, not the extractor
+            message_chunk, metadata = chunk
+            if metadata.get("langgraph_node") != "agent":
+                continue
+            delta = message_chunk.content if isinstance(message_chunk.content, str) else ""
+            if delta:
+                streamed_text += delta
+                yield {"delta": delta}
+        
+        # Nodes that don't call the LLM (e.g. the greeting) emit no tokens
+        if response_text.startswith(streamed_text) and len(response_text) > len(streamed_text):
+            yield {"delta": response_text[len(streamed_text):]}
+        
+        payload = final_state.get("payload", {}) if final_state else {}
+        is_complete = final_state.get("is_form_complete", False) if final_state else False
+        extracted = final_state.get("extracted", False) if final_state else False
+        
+        yield {
+            "response": response_text,
+            "payload": payload,
+            "is_form_complete": is_complete,
+            "extracted": extracted,
+        }
+    
+    async def record_turn(
+        self,
+        thread_id: str,
+        message: str,
+        response: str,
+    ) -> None:
+        """
+        Append a turn to the conversation memory without running the graph.
+        
+        Used when a response is served from cache, so later turns still
+        see it in the conversation history.
+        
+        Args:
+            thread_id: Conversation thread ID
+            message: User message text
+            response: Agent response text
+        """
+        if not self.use_memory:
+            return
+        
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id}
         }
+        await self.graph.aupdate_state(
+            config,
+            {"messages": [HumanMessage(content=message), AIMessage(content=response)]},
+            as_node="extractor",
+        )
+    
+    async def apply_turn(
+        self,
+        thread_id: str,
+        message: str,
+        response: str,
+    ) -> Dict[str, Any]:
+        """
+        Append a pre-generated turn and run extraction on it.
+        
+        Skips the agent node but still extracts from the user message, so
+        the payload picks up whatever the user said.
+        
+        Args:
+            thread_id: Conversation thread ID
+            message: User message text
+            response: Agent response text
+            
+        Returns:
+            Dict with response, payload, and completion status
+        """
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id}
+        }
+        await self.graph.aupdate_state(
+            config,
+            {"messages": [HumanMessage(content=message), AIMessage(content=response)]},
+            as_node="agent",
+        )
+        snapshot = await self.graph.aget_state(config)
+        update = await self._extractor_node(snapshot.values, config)
+        await self.graph.aupdate_state(config, update, as_node="extractor")
+        
+        return {"response": response, **update}
+    
+    async def predict_next_turn(self, thread_id: str) -> Optional[PredictedTurn]:
+        """
+        Predict the user's next reply and the response to it.
+        
+        Args:
+            thread_id: Conversation thread ID
+            
+        Returns:
+            PredictedTurn, or None if the thread has no memory or prediction fails
+        """
+        if not self.use_memory:
+            return None
+        
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id}
+        }
+        snapshot = await self.graph.aget_state(config)
+        messages = snapshot.values.get("messages", [])
+        if not messages:
+            return None
+        
+        try:
+            return await self.prefetch_chain.ainvoke({
+                "messages": [*messages, SystemMessage(content=PREFETCH_INSTRUCTION)],
+                "time": get_prompt_time(),
+            })
+        except Exception as e:
+            logger.warning(f"Next turn prediction failed: {e}")
+            return None
 
 
 # Agent cache - stores agents by form_config_id
 _agent_cache: Dict[str, DynamicAgent] = {}
 
+# Guards the agent cache, which may be accessed from worker threads
+_agent_cache_lock = threading.Lock()
+
 
 def get_or_create_agent(form_config: FormConfig) -> DynamicAgent:
     """
@@ -303,11 +499,12 @@ def get_or_create_agent(form_config: FormConfig) -> DynamicAgent:
     Returns:
         DynamicAgent instance
     """
-    if form_config.id not in _agent_cache:
-        _agent_cache[form_config.id] = DynamicAgent(form_config)
-        logger.info(f"Created new agent for form: {form_config.name}")
-    
-    return _agent_cache[form_config.id]
+    with _agent_cache_lock:
+        if form_config.id not in _agent_cache:
+            _agent_cache[form_config.id] = DynamicAgent(form_config)
+            logger.info(f"Created new agent for form: {form_config.name}")
+        
+        return _agent_cache[form_config.id]
 
 
 def clear_agent_cache(form_config_id: Optional[str] = None) -> None:
@@ -318,10 +515,12 @@ def clear_agent_cache(form_config_id: Optional[str] = None) -> None:
         form_config_id: Specific config to clear, or None to clear all
     """
     global _agent_cache
-    if form_config_id:
-        if form_config_id in _agent_cache:
-            del _agent_cache[form_config_id]
-            logger.info(f"Cleared agent for form: {form_config_id}")
-    else:
-        _agent_cache = {}
-        logger.info("Cleared all agents from cache")
+    get_semantic_cache().clear(form_config_id)
+    with _agent_cache_lock:
+        if form_config_id:
+            if form_config_id in _agent_cache:
+                del _agent_cache[form_config_id]
+                logger.info(f"Cleared agent for form: {form_config_id}")
+        else:
+            _agent_cache = {}
+            logger.info("Cleared all agents from cache")
@@ -7,7 +7,6 @@ Manages conversation flow and claim data extraction.
 
 import logging
 from typing import Dict, Any, List, Optional, TypedDict, Annotated
-from datetime import datetime
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.runnables import RunnableConfig
@@ -20,7 +19,7 @@ from trustcall import create_extractor
 from app.core.config import settings
 from app.models.claim import FNOLPayload, create_default_payload
 from app.services.llm import create_llm
-from .prompts import create_prompt_template
+from .prompts import create_prompt_template, get_prompt_time
 from .tools import AGENT_TOOLS
 
 logger = logging.getLogger(__name__)
@@ -138,7 +137,7 @@ class FNOLAgent:
         # Prepare state for the chain
         chain_input = {
             "messages": messages,
-            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "time": get_prompt_time()
         }
         
         # Get response from LLM
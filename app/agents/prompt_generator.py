@@ -140,8 +140,6 @@ Once you have all required information:
 
 ## Starting the Conversation
 {config.agent.custom_greeting if config.agent.custom_greeting else f"Begin with a warm greeting, introduce yourself as {config.agent.name}, explain you're here to help gather some information, and ask your first question."}
-
-Current date and time: {{time}}
 """
     
     return prompt
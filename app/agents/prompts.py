@@ -8,11 +8,21 @@ For new forms, use the dynamic prompt generator.
 """
 
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
 from langchain_core.prompts import ChatPromptTemplate
 
-# Supported languages with their system prompts
-SUPPORTED_LANGUAGES: Dict[str, str] = {
+# Format of the {time} prompt variable
+PROMPT_TIME_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+# Volatile part of the system prompt, sent as its own message after the
+# static prompt so the static prefix stays byte-identical across requests
+# and provider-side prompt caching can hit
+TIME_PROMPT: Final[str] = "Current date and time: {time}."
+
+# Supported languages with their system prompts (read-only)
+SUPPORTED_LANGUAGES: Mapping[str, str] = MappingProxyType({
     "en": "English",
     "es": "Spanish",
     "fr": "French", 
@@ -22,10 +32,10 @@ SUPPORTED_LANGUAGES: Dict[str, str] = {
     "zh": "Chinese",
     "ja": "Japanese",
     "ko": "Korean",
-}
+})
 
 # Base system prompt in English
-SYSTEM_PROMPT_EN = """
+SYSTEM_PROMPT_EN: Final[str] = """
 You are a friendly and empathetic voice assistant for First Notice of Loss (FNOL) claims processing. Your main goal is to collect claim information through a natural, voice-first conversation.
 
 Speak in a clear, conversational tone. Ask one question at a time and wait for a response. Keep your responses concise and suitable for voice interaction.
@@ -68,7 +78,7 @@ Begin with a warm and clear introduction.
 """
 
 # Spanish system prompt
-SYSTEM_PROMPT_ES = """
+SYSTEM_PROMPT_ES: Final[str] = """
 Eres un asistente de voz amigable y empático para el procesamiento de reclamos de Primera Notificación de Pérdida (FNOL). Tu objetivo principal es recopilar información del reclamo a través de una conversación natural, orientada a la voz.
 
 Habla con un tono claro y conversacional. Haz una pregunta a la vez y espera la respuesta. Mantén tus respuestas concisas y adecuadas para la interacción por voz.
@@ -98,7 +108,7 @@ Comienza con una introducción cálida y clara.
 """
 
 # French system prompt
-SYSTEM_PROMPT_FR = """
+SYSTEM_PROMPT_FR: Final[str] = """
 Vous êtes un assistant vocal amical et empathique pour le traitement des déclarations de sinistre (FNOL). Votre objectif principal est de collecter les informations de réclamation à travers une conversation naturelle, orientée vers la voix.
 
 Parlez d'un ton clair et conversationnel. Posez une question à la fois et attendez la réponse. Gardez vos réponses concises et adaptées à l'interaction vocale.
@@ -122,13 +132,13 @@ Parlez d'un ton clair et conversationnel. Posez une question à la fois et atten
 Commencez par une introduction chaleureuse et claire.
 """
 
-# Language code to prompt mapping
-PROMPTS_BY_LANGUAGE = {
+# Language code to prompt mapping (read-only)
+PROMPTS_BY_LANGUAGE: Mapping[str, str] = MappingProxyType({
     "en": SYSTEM_PROMPT_EN,
     "es": SYSTEM_PROMPT_ES,
     "fr": SYSTEM_PROMPT_FR,
     # Other languages fall back to English
-}
+})
 
 
 def get_system_prompt(language: str = "en") -> str:
@@ -144,10 +154,25 @@ def get_system_prompt(language: str = "en") -> str:
     return PROMPTS_BY_LANGUAGE.get(language, SYSTEM_PROMPT_EN)
 
 
+def get_prompt_time() -> str:
+    """
+    Get the current time for the ``{time}`` prompt variable.
+    
+    Pass this at invoke time so cached templates always see a fresh time.
+    """
+    return datetime.now().strftime(PROMPT_TIME_FORMAT)
+
+
+@lru_cache(maxsize=16)
 def create_prompt_template(language: str = "en") -> ChatPromptTemplate:
     """
     Create a ChatPromptTemplate with the system prompt.
     
+    Templates are cached per language. The current time is not baked in;
+    callers must pass ``time=get_prompt_time()`` when invoking the template.
+    It goes in a separate system message after the static prompt, so the
+    prompt prefix is identical on every request.
+    
     Args:
         language: Language code for the system prompt
         
@@ -157,9 +182,7 @@ def create_prompt_template(language: str = "en") -> ChatPromptTemplate:
     system_prompt = get_system_prompt(language)
     
     return ChatPromptTemplate.from_messages([
-        (
-            "system",
-            system_prompt + "\n\nCurrent date and time: {time}.",
-        ),
+        ("system", system_prompt),
+        ("system", TIME_PROMPT),
         ("placeholder", "{messages}"),
-    ]).partial(time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    ])
@@ -2,15 +2,21 @@
 Notera AI - FastAPI Application
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.api.responses import ORJSONResponse
 from app.api.routes import chat_router, health_router, forms_router, settings_router
 from app.services.persistence import init_database, init_form_database
+from app.services.voice import synthesize_speech_base64, set_http_client
+from app.agents.prompt_generator import generate_greeting
+from app.api.routes.forms import get_or_create_demo_config
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +26,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def warm_tts_cache() -> None:
+    """Pre-synthesize the demo greeting so the first session gets instant audio."""
+    try:
+        # Loading (or creating) the demo config hits SQLite, so keep it off the loop
+        config = await asyncio.to_thread(get_or_create_demo_config)
+        greeting = generate_greeting(config)
+        await synthesize_speech_base64(greeting)
+        logger.info("TTS cache warmed")
+    except Exception as e:
+        logger.warning(f"TTS cache warm-up failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -41,10 +59,27 @@ async def lifespan(app: FastAPI):
         for error in errors:
             logger.warning(f"Config warning: {error}")
     
+    # Shared connection pool for OpenAI voice calls
+    http_client = httpx.AsyncClient(
+        timeout=settings.request_timeout,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=256),
+    )
+    app.state.http_client = http_client
+    set_http_client(http_client)
+    
+    # Warm TTS cache in the background so startup isn't blocked
+    warm_task = None
+    if settings.enable_caching and settings.openai_api_key:
+        warm_task = asyncio.create_task(warm_tts_cache())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    if warm_task and not warm_task.done():
+        warm_task.cancel()
+    set_http_client(None)
+    await http_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -55,6 +90,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="No-Code AI Conversational Form Builder",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if not settings.is_production else None,
         redoc_url="/redoc" if not settings.is_production else None,
     )
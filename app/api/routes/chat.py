@@ -1,20 +1,36 @@
 """Chat API endpoints."""
 
+import re
+import json
 import uuid
-import base64
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, AsyncIterator, Literal
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, model_serializer
 
 from app.core.config import settings
 from app.agents import create_agent
-from app.agents.dynamic_agent import DynamicAgent, get_or_create_agent
-from app.services.voice import transcribe_audio, synthesize_speech
-from app.services.persistence import save_conversation, load_conversation, delete_conversation
-from app.api.routes.forms import get_form_config, get_or_create_demo_config
+from app.agents.dynamic_agent import DynamicAgent
+from app.services.voice import (
+    transcribe_audio,
+    synthesize_speech,
+    synthesize_speech_base64,
+    decode_audio_base64,
+)
+from app.services.semantic_cache import CachedResponse, get_semantic_cache
+from app.services.prefetch import get_prefetch_cache
+from app.services.persistence import (
+    save_conversation,
+    load_conversation,
+    delete_conversation,
+    get_session_store,
+    get_audio_store,
+)
+from app.api.routes.forms import resolve_agent
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +54,14 @@ class StartRequest(BaseModel):
     thread_id: Optional[str] = None
     language: Optional[str] = Field(default="en", description="Language code")
     form_id: Optional[str] = Field(default=None, description="Form configuration ID")
+    audio_format: Literal["base64", "url"] = Field(
+        default="base64",
+        description="Return TTS audio inline as base64, or as a URL to fetch it from"
+    )
+    include_history: bool = Field(
+        default=True,
+        description="Include the full chat_history; new_messages is always included"
+    )
 
 
 class MessageRequest(BaseModel):
@@ -46,6 +70,14 @@ class MessageRequest(BaseModel):
     thread_id: str
     language: Optional[str] = None
     form_id: Optional[str] = Field(default=None, description="Form configuration ID")
+    audio_format: Literal["base64", "url"] = Field(
+        default="base64",
+        description="Return TTS audio inline as base64, or as a URL to fetch it from"
+    )
+    include_history: bool = Field(
+        default=True,
+        description="Include the full chat_history; new_messages is always included"
+    )
 
 
 class VoiceRequest(BaseModel):
@@ -54,57 +86,358 @@ class VoiceRequest(BaseModel):
     thread_id: str
     language: Optional[str] = None
     form_id: Optional[str] = Field(default=None, description="Form configuration ID")
+    audio_format: Literal["base64", "url"] = Field(
+        default="base64",
+        description="Return TTS audio inline as base64, or as a URL to fetch it from"
+    )
+    include_history: bool = Field(
+        default=True,
+        description="Include the full chat_history; new_messages is always included"
+    )
 
 
 class ChatResponse(BaseModel):
     """Response from chat endpoints."""
     message: str
-    chat_history: List[ChatMessage]
+    chat_history: Optional[List[ChatMessage]] = None  # omitted if include_history is false
+    new_messages: List[ChatMessage] = Field(default_factory=list)  # messages added by this call
+    turn_index: int = 0  # index of the last new message in the full chat history
     payload: Dict[str, Any]
     is_form_complete: bool
-    thread_id: str
+    thread_id: str  # opaque ID; new sessions get 32 hex chars (no dashes)
     audio_data: Optional[str] = None  # base64 encoded TTS response
+    audio_url: Optional[str] = None  # TTS response URL, when audio_format is "url"
     language: str = "en"
     processing_time: Optional[float] = None
+    
+    @model_serializer(mode="wrap")
+    def _omit_missing_history(self, handler):
+        """Leave chat_history out of the response entirely when it wasn't requested."""
+        data = handler(self)
+        if self.chat_history is None:
+            data.pop("chat_history", None)
+        return data
 
 
 # ===========================================
 # Session Management
 # ===========================================
 
-# In-memory session storage (for production, use Redis or database)
-_sessions: Dict[str, Dict[str, Any]] = {}
+_session_store = get_session_store()
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
 
 
-def get_or_create_session(
+async def get_or_create_session(
     thread_id: Optional[str] = None, 
     language: str = "en",
-    form_id: Optional[str] = None
+    form_id: Optional[str] = None,
+    now_iso: Optional[str] = None,
 ) -> tuple[str, Dict[str, Any]]:
     """Get existing session or create new one."""
     if not thread_id:
-        thread_id = str(uuid.uuid4())
+        thread_id = uuid.uuid4().hex
     
-    if thread_id not in _sessions:
-        _sessions[thread_id] = {
+    session = await _session_store.get(thread_id)
+    if session is None:
+        session = {
             "thread_id": thread_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso or _now_iso(),
             "chat_history": [],
             "payload": {},
             "is_form_complete": False,
             "language": language,
             "form_id": form_id,
         }
+        await _session_store.set(thread_id, session)
         logger.info(f"Created new session: {thread_id} (form: {form_id})")
     
-    return thread_id, _sessions[thread_id]
+    return thread_id, session
 
 
-def update_session(thread_id: str, updates: Dict[str, Any]) -> None:
+async def save_session(thread_id: str, session: Dict[str, Any]) -> None:
+    """Persist a session after it has been modified."""
+    await _session_store.set(thread_id, session)
+
+
+async def update_session(thread_id: str, updates: Dict[str, Any]) -> None:
     """Update session data."""
-    if thread_id in _sessions:
-        _sessions[thread_id].update(updates)
-        _sessions[thread_id]["updated_at"] = datetime.now().isoformat()
+    session = await _session_store.get(thread_id)
+    if session is not None:
+        session.update(updates)
+        session["updated_at"] = _now_iso()
+        await _session_store.set(thread_id, session)
+
+
+def _history_fields(
+    session: Dict[str, Any],
+    new_message_count: int,
+    include_history: bool,
+) -> Dict[str, Any]:
+    """Build the chat_history / new_messages / turn_index response fields."""
+    chat_history = session["chat_history"]
+    return {
+        "chat_history": chat_history if include_history else None,
+        "new_messages": chat_history[-new_message_count:],
+        "turn_index": len(chat_history) - 1,
+    }
+
+
+def get_agent(form_id: Optional[str]) -> DynamicAgent:
+    """
+    Get the agent for a form, falling back to the demo config.
+    
+    May load from SQLite on a cache miss, so call via ``asyncio.to_thread``.
+    """
+    try:
+        _, agent = resolve_agent(form_id)
+    except KeyError:
+        _, agent = resolve_agent(None)
+    return agent
+
+
+# ===========================================
+# Turn Processing
+# ===========================================
+
+_semantic_cache = get_semantic_cache()
+_prefetch_cache = get_prefetch_cache()
+_audio_store = get_audio_store()
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    """Run a coroutine in the background."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _last_assistant_message(chat_history: List[Dict[str, Any]]) -> str:
+    """Get the most recent assistant message in a chat history."""
+    for message in reversed(chat_history):
+        if message.get("role") == "assistant":
+            return message.get("content", "")
+    return ""
+
+
+async def _synthesize(
+    text: str,
+    audio_format: str = "base64",
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Synthesize TTS audio for a response.
+    
+    Returns:
+        Tuple of (base64 audio, audio URL); at most one is set, and both
+        are None if synthesis fails
+    """
+    try:
+        if audio_format == "url":
+            audio_id = await _audio_store.put(await synthesize_speech(text))
+            return None, f"{router.prefix}/audio/{audio_id}"
+        return await synthesize_speech_base64(text), None
+    except Exception as e:
+        logger.warning(f"TTS failed: {e}")
+        return None, None
+
+
+async def _run_turn(
+    agent: DynamicAgent,
+    session: Dict[str, Any],
+    thread_id: str,
+    message: str,
+    audio_format: str = "base64",
+) -> tuple[Dict[str, Any], Optional[str], Optional[str]]:
+    """
+    Get the agent's response and TTS audio for a user message.
+    
+    With the semantic cache enabled, content-free replies (confirmations,
+    acknowledgements) the cache has seen before, to the same agent question
+    in the same payload state, are answered from cache. Only such replies
+    are cached, and only when extraction ran and left the payload
+    unchanged, since a cached turn is replayed without extraction.
+    
+    With prefetch enabled, the next turn is predicted in the background
+    after each response; a reply matching the prediction skips the LLM
+    and TTS calls and only runs extraction.
+    
+    Returns:
+        Tuple of (agent result, base64 audio, audio URL)
+    """
+    form_id = agent.form_config.id
+    context = _last_assistant_message(session["chat_history"])
+    
+    if settings.enable_prefetch:
+        prefetched = await _prefetch_cache.lookup(thread_id, context, message)
+        if prefetched:
+            result = await agent.apply_turn(thread_id, message, prefetched.response)
+            _spawn(_prefetch_cache.prefetch(agent, thread_id, prefetched.response))
+            if audio_format == "base64" and prefetched.audio_data:
+                return result, prefetched.audio_data, None
+            return (result, *await _synthesize(prefetched.response, audio_format))
+    
+    if settings.enable_semantic_cache:
+        cached = await _semantic_cache.lookup(
+            form_id, context, session.get("payload", {}), message
+        )
+        if cached:
+            await agent.record_turn(thread_id, message, cached.response)
+            if settings.enable_prefetch:
+                _spawn(_prefetch_cache.prefetch(agent, thread_id, cached.response))
+            result = {
+                "response": cached.response,
+                "payload": session.get("payload", {}),
+                "is_form_complete": session.get("is_form_complete", False),
+            }
+            if audio_format == "base64" and cached.audio_data:
+                return result, cached.audio_data, None
+            return (result, *await _synthesize(cached.response, audio_format))
+    
+    result = await agent.process_message(
+        message=message,
+        thread_id=thread_id,
+        is_conversation_start=False
+    )
+    
+    response_text = result.get("response", "")
+    
+    if settings.enable_prefetch and response_text:
+        _spawn(_prefetch_cache.prefetch(agent, thread_id, response_text))
+    
+    # Generate TTS audio
+    audio_data = audio_url = None
+    if response_text:
+        audio_data, audio_url = await _synthesize(response_text, audio_format)
+    
+    payload = result.get("payload", {})
+    if (
+        settings.enable_semantic_cache
+        and response_text
+        and result.get("extracted")
+        and payload == session.get("payload", {})
+    ):
+        _spawn(_semantic_cache.store(
+            form_id, context, payload, message, CachedResponse(response_text, audio_data)
+        ))
+    
+    return result, audio_data, audio_url
+
+
+# ===========================================
+# Streaming Helpers
+# ===========================================
+
+# Sentence end followed by whitespace, so "3.5" or "e.g.," don't split early
+_SENTENCE_END = re.compile(r"[.?!]+(?=\s)")
+
+# Minimum characters per TTS chunk, to avoid many tiny synthesis calls
+MIN_TTS_CHUNK_CHARS = 20
+
+
+def _split_sentences(buffer: str) -> tuple[List[str], str]:
+    """Split complete sentences off a text buffer, returning (sentences, rest)."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(buffer):
+        end = match.end()
+        if end - start >= MIN_TTS_CHUNK_CHARS:
+            sentences.append(buffer[start:end].strip())
+            start = end
+    return sentences, buffer[start:]
+
+
+def _sse(data: Dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"data: {json.dumps(data)}\n\n"
+
+
+async def _stream_turn(
+    agent: DynamicAgent,
+    session: Dict[str, Any],
+    thread_id: str,
+    message: str,
+    language: str,
+    start_time: float,
+    now_iso: str,
+) -> AsyncIterator[str]:
+    """
+    Stream an agent turn as server-sent events.
+    
+    LLM tokens are grouped into sentences and pushed onto a queue, which is
+    drained concurrently by TTS so the first audio chunk is sent while the
+    rest of the response is still being generated.
+    """
+    import time
+    
+    queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+    result: Dict[str, Any] = {}
+    
+    async def produce() -> None:
+        buffer = ""
+        try:
+            async for event in agent.astream_message(message=message, thread_id=thread_id):
+                if "delta" in event:
+                    sentences, buffer = _split_sentences(buffer + event["delta"])
+                    for sentence in sentences:
+                        await queue.put(sentence)
+                else:
+                    result.update(event)
+            if buffer.strip():
+                await queue.put(buffer.strip())
+        finally:
+            await queue.put(None)
+    
+    producer = asyncio.create_task(produce())
+    
+    try:
+        while (chunk := await queue.get()) is not None:
+            audio_data = None
+            try:
+                audio_data = await synthesize_speech_base64(chunk)
+            except Exception as e:
+                logger.warning(f"TTS failed: {e}")
+            yield _sse({"text": chunk, "audio": audio_data})
+        
+        await producer
+    except Exception as e:
+        logger.error(f"Failed to stream message: {e}")
+        yield _sse({"error": str(e)})
+        return
+    finally:
+        if not producer.done():
+            producer.cancel()
+    
+    response_text = result.get("response", "")
+    
+    # Add assistant message to history
+    session["chat_history"].append({
+        "role": "assistant",
+        "content": response_text,
+        "timestamp": now_iso,
+        "is_voice": False,
+    })
+    
+    # Update session
+    session["payload"] = result.get("payload", session.get("payload", {}))
+    session["is_form_complete"] = result.get("is_form_complete", False)
+    await save_session(thread_id, session)
+    
+    yield _sse({
+        "done": True,
+        "message": response_text,
+        "payload": session["payload"],
+        "is_form_complete": session["is_form_complete"],
+        "thread_id": thread_id,
+        "turn_index": len(session["chat_history"]) - 1,
+        "language": language,
+        "processing_time": time.time() - start_time,
+    })
 
 
 # ===========================================
@@ -116,23 +449,18 @@ async def start_conversation(request: StartRequest = StartRequest()):
     """Start a new conversation and get initial AI message."""
     import time
     start_time = time.time()
+    now_iso = _now_iso()
     
     language = request.language or settings.default_language
     form_id = request.form_id
-    thread_id, session = get_or_create_session(request.thread_id, language, form_id)
+    thread_id, session = await get_or_create_session(request.thread_id, language, form_id, now_iso)
     
     try:
-        # Determine which agent to use
-        if form_id:
-            # Use dynamic agent with specific form config
-            form_config = get_form_config(form_id)
-            if not form_config:
-                raise HTTPException(status_code=404, detail=f"Form config not found: {form_id}")
-            agent = get_or_create_agent(form_config)
-        else:
-            # Use demo config or legacy agent
-            form_config = get_or_create_demo_config()
-            agent = get_or_create_agent(form_config)
+        # Determine which agent to use (demo config if no form_id)
+        try:
+            form_config, agent = await asyncio.to_thread(resolve_agent, form_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Form config not found: {form_id}")
         
         # Process initial greeting
         result = await agent.process_message(
@@ -145,35 +473,30 @@ async def start_conversation(request: StartRequest = StartRequest()):
         response_text = result.get("response", "Hello! I'm here to help you today.")
         
         # Generate TTS audio
-        audio_data = None
-        try:
-            audio_bytes = await synthesize_speech(response_text)
-            audio_data = base64.b64encode(audio_bytes).decode()
-        except Exception as e:
-            logger.warning(f"TTS failed: {e}")
+        audio_data, audio_url = await _synthesize(response_text, request.audio_format)
         
         # Update session
-        assistant_message = ChatMessage(
-            role="assistant",
-            content=response_text,
-            timestamp=datetime.now().isoformat()
-        )
-        session["chat_history"].append(assistant_message.model_dump())
+        session["chat_history"].append({
+            "role": "assistant",
+            "content": response_text,
+            "timestamp": now_iso,
+            "is_voice": False,
+        })
         session["payload"] = result.get("payload", {})
-        if hasattr(session["payload"], "model_dump"):
-            session["payload"] = session["payload"].model_dump()
         session["is_form_complete"] = result.get("is_form_complete", False)
         session["form_id"] = form_id or form_config.id
+        await save_session(thread_id, session)
         
         processing_time = time.time() - start_time
         
         return ChatResponse(
             message=response_text,
-            chat_history=session["chat_history"],
+            **_history_fields(session, 1, request.include_history),
             payload=session["payload"],
             is_form_complete=session["is_form_complete"],
             thread_id=thread_id,
             audio_data=audio_data,
+            audio_url=audio_url,
             language=language,
             processing_time=processing_time
         )
@@ -190,71 +513,52 @@ async def send_message(request: MessageRequest):
     """Send a text message and get AI response."""
     import time
     start_time = time.time()
+    now_iso = _now_iso()
     
-    thread_id, session = get_or_create_session(request.thread_id)
+    thread_id, session = await get_or_create_session(request.thread_id, now_iso=now_iso)
     language = request.language or session.get("language", "en")
     form_id = request.form_id or session.get("form_id")
     
     try:
         # Add user message to history
-        user_message = ChatMessage(
-            role="user",
-            content=request.message,
-            timestamp=datetime.now().isoformat()
-        )
-        session["chat_history"].append(user_message.model_dump())
+        session["chat_history"].append({
+            "role": "user",
+            "content": request.message,
+            "timestamp": now_iso,
+            "is_voice": False,
+        })
         
         # Get appropriate agent
-        if form_id:
-            form_config = get_form_config(form_id)
-            if not form_config:
-                form_config = get_or_create_demo_config()
-            agent = get_or_create_agent(form_config)
-        else:
-            form_config = get_or_create_demo_config()
-            agent = get_or_create_agent(form_config)
+        agent = await asyncio.to_thread(get_agent, form_id)
         
-        result = await agent.process_message(
-            message=request.message,
-            thread_id=thread_id,
-            is_conversation_start=False
+        result, audio_data, audio_url = await _run_turn(
+            agent, session, thread_id, request.message, request.audio_format
         )
-        
         response_text = result.get("response", "")
         
-        # Generate TTS audio
-        audio_data = None
-        if response_text:
-            try:
-                audio_bytes = await synthesize_speech(response_text)
-                audio_data = base64.b64encode(audio_bytes).decode()
-            except Exception as e:
-                logger.warning(f"TTS failed: {e}")
-        
         # Add assistant message to history
-        assistant_message = ChatMessage(
-            role="assistant",
-            content=response_text,
-            timestamp=datetime.now().isoformat()
-        )
-        session["chat_history"].append(assistant_message.model_dump())
+        session["chat_history"].append({
+            "role": "assistant",
+            "content": response_text,
+            "timestamp": now_iso,
+            "is_voice": False,
+        })
         
         # Update session
-        payload = result.get("payload", session.get("payload", {}))
-        if hasattr(payload, "model_dump"):
-            payload = payload.model_dump()
-        session["payload"] = payload
+        session["payload"] = result.get("payload", session.get("payload", {}))
         session["is_form_complete"] = result.get("is_form_complete", False)
+        await save_session(thread_id, session)
         
         processing_time = time.time() - start_time
         
         return ChatResponse(
             message=response_text,
-            chat_history=session["chat_history"],
+            **_history_fields(session, 2, request.include_history),
             payload=session["payload"],
             is_form_complete=session["is_form_complete"],
             thread_id=thread_id,
             audio_data=audio_data,
+            audio_url=audio_url,
             language=language,
             processing_time=processing_time
         )
@@ -269,83 +573,66 @@ async def send_voice_message(request: VoiceRequest):
     """Send a voice message and get AI response with audio."""
     import time
     start_time = time.time()
+    now_iso = _now_iso()
     
-    thread_id, session = get_or_create_session(request.thread_id)
+    thread_id, session = await get_or_create_session(request.thread_id, now_iso=now_iso)
     language = request.language or session.get("language", "en")
     form_id = request.form_id or session.get("form_id")
     
     try:
         # Decode audio
-        audio_bytes = base64.b64decode(request.audio_data)
+        audio_bytes = await decode_audio_base64(request.audio_data)
         logger.info(f"Received audio: {len(audio_bytes)} bytes")
         
-        # Transcribe audio
-        transcribed_text = await transcribe_audio(audio_bytes, language=language)
+        # Transcribe audio while the agent is resolved
+        transcribe_task = asyncio.create_task(transcribe_audio(audio_bytes, language=language))
+        try:
+            agent = await asyncio.to_thread(get_agent, form_id)
+        except Exception:
+            transcribe_task.cancel()
+            raise
+        transcribed_text = await transcribe_task
         logger.info(f"Transcribed: {transcribed_text}")
         
         if not transcribed_text:
             raise HTTPException(status_code=400, detail="No speech detected in audio")
         
         # Add user message to history (with voice indicator)
-        user_message = ChatMessage(
-            role="user",
-            content=transcribed_text,
-            timestamp=datetime.now().isoformat(),
-            is_voice=True
-        )
-        session["chat_history"].append(user_message.model_dump())
+        session["chat_history"].append({
+            "role": "user",
+            "content": transcribed_text,
+            "timestamp": now_iso,
+            "is_voice": True,
+        })
         
-        # Get appropriate agent
-        if form_id:
-            form_config = get_form_config(form_id)
-            if not form_config:
-                form_config = get_or_create_demo_config()
-            agent = get_or_create_agent(form_config)
-        else:
-            form_config = get_or_create_demo_config()
-            agent = get_or_create_agent(form_config)
-        
-        result = await agent.process_message(
-            message=transcribed_text,
-            thread_id=thread_id,
-            is_conversation_start=False
+        result, audio_data, audio_url = await _run_turn(
+            agent, session, thread_id, transcribed_text, request.audio_format
         )
-        
         response_text = result.get("response", "")
         
-        # Generate TTS audio
-        audio_data = None
-        if response_text:
-            try:
-                audio_bytes = await synthesize_speech(response_text)
-                audio_data = base64.b64encode(audio_bytes).decode()
-            except Exception as e:
-                logger.warning(f"TTS failed: {e}")
-        
         # Add assistant message to history
-        assistant_message = ChatMessage(
-            role="assistant",
-            content=response_text,
-            timestamp=datetime.now().isoformat()
-        )
-        session["chat_history"].append(assistant_message.model_dump())
+        session["chat_history"].append({
+            "role": "assistant",
+            "content": response_text,
+            "timestamp": now_iso,
+            "is_voice": False,
+        })
         
         # Update session
-        payload = result.get("payload", session.get("payload", {}))
-        if hasattr(payload, "model_dump"):
-            payload = payload.model_dump()
-        session["payload"] = payload
+        session["payload"] = result.get("payload", session.get("payload", {}))
         session["is_form_complete"] = result.get("is_form_complete", False)
+        await save_session(thread_id, session)
         
         processing_time = time.time() - start_time
         
         return ChatResponse(
             message=response_text,
-            chat_history=session["chat_history"],
+            **_history_fields(session, 2, request.include_history),
             payload=session["payload"],
             is_form_complete=session["is_form_complete"],
             thread_id=thread_id,
             audio_data=audio_data,
+            audio_url=audio_url,
             language=language,
             processing_time=processing_time
         )
@@ -357,13 +644,109 @@ async def send_voice_message(request: VoiceRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/message/stream")
+async def stream_message(request: MessageRequest):
+    """
+    Send a text message and stream the AI response as server-sent events.
+    
+    Each event carries a sentence of text with its TTS audio; the last
+    event has ``done: true`` along with the updated payload.
+    """
+    import time
+    start_time = time.time()
+    now_iso = _now_iso()
+    
+    thread_id, session = await get_or_create_session(request.thread_id, now_iso=now_iso)
+    language = request.language or session.get("language", "en")
+    form_id = request.form_id or session.get("form_id")
+    
+    # Add user message to history
+    session["chat_history"].append({
+        "role": "user",
+        "content": request.message,
+        "timestamp": now_iso,
+        "is_voice": False,
+    })
+    
+    # Get appropriate agent
+    try:
+        agent = await asyncio.to_thread(get_agent, form_id)
+    except Exception as e:
+        logger.error(f"Failed to process message: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Save the user message now, so it's kept by any store even if the stream fails
+    await save_session(thread_id, session)
+    
+    return StreamingResponse(
+        _stream_turn(agent, session, thread_id, request.message, language, start_time, now_iso),
+        media_type="text/event-stream",
+    )
+
+
+@router.post("/voice/stream")
+async def stream_voice_message(request: VoiceRequest):
+    """Send a voice message and stream the AI response as server-sent events."""
+    import time
+    start_time = time.time()
+    now_iso = _now_iso()
+    
+    thread_id, session = await get_or_create_session(request.thread_id, now_iso=now_iso)
+    language = request.language or session.get("language", "en")
+    form_id = request.form_id or session.get("form_id")
+    
+    try:
+        # Decode audio, then transcribe it while the agent is resolved
+        audio_bytes = await decode_audio_base64(request.audio_data)
+        transcribe_task = asyncio.create_task(transcribe_audio(audio_bytes, language=language))
+        try:
+            agent = await asyncio.to_thread(get_agent, form_id)
+        except Exception:
+            transcribe_task.cancel()
+            raise
+        transcribed_text = await transcribe_task
+        logger.info(f"Transcribed: {transcribed_text}")
+    except Exception as e:
+        logger.error(f"Failed to transcribe voice message: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if not transcribed_text:
+        raise HTTPException(status_code=400, detail="No speech detected in audio")
+    
+    # Add user message to history (with voice indicator)
+    session["chat_history"].append({
+        "role": "user",
+        "content": transcribed_text,
+        "timestamp": now_iso,
+        "is_voice": True,
+    })
+    
+    # Save the user message now, so it's kept by any store even if the stream fails
+    await save_session(thread_id, session)
+    
+    return StreamingResponse(
+        _stream_turn(agent, session, thread_id, transcribed_text, language, start_time, now_iso),
+        media_type="text/event-stream",
+    )
+
+
+@router.get("/audio/{audio_id}")
+async def get_audio(audio_id: str):
+    """Get synthesized TTS audio returned by URL (``audio_format="url"``)."""
+    audio = await _audio_store.get(audio_id)
+    if audio is None:
+        raise HTTPException(status_code=404, detail="Audio not found or expired")
+    
+    return Response(content=audio, media_type="audio/mpeg")
+
+
 @router.get("/{thread_id}/payload")
 async def get_payload(thread_id: str):
     """Get current payload for a thread."""
-    if thread_id not in _sessions:
+    session = await _session_store.get(thread_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = _sessions[thread_id]
     return {
         "payload": session.get("payload", {}),
         "is_form_complete": session.get("is_form_complete", False)
@@ -373,10 +756,10 @@ async def get_payload(thread_id: str):
 @router.get("/{thread_id}/history")
 async def get_history(thread_id: str):
     """Get conversation history for a thread."""
-    if thread_id not in _sessions:
+    session = await _session_store.get(thread_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = _sessions[thread_id]
     return {
         "thread_id": thread_id,
         "chat_history": session.get("chat_history", []),
@@ -387,25 +770,31 @@ async def get_history(thread_id: str):
 @router.delete("/{thread_id}")
 async def reset_conversation(thread_id: str):
     """Reset/delete a conversation."""
-    if thread_id in _sessions:
-        del _sessions[thread_id]
+    _prefetch_cache.discard(thread_id)
+    if await _session_store.delete(thread_id):
         logger.info(f"Deleted session: {thread_id}")
     
     return {"message": "Conversation reset successfully"}
 
 
 @router.get("/sessions/list")
-async def list_sessions():
-    """List all active sessions (for debugging)."""
+async def list_sessions(
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+):
+    """List active sessions, a page at a time (for debugging)."""
+    sessions, count = await _session_store.page(limit=limit, offset=offset)
     return {
-        "count": len(_sessions),
+        "count": count,
+        "limit": limit,
+        "offset": offset,
         "sessions": [
             {
-                "thread_id": tid,
+                "thread_id": s.get("thread_id"),
                 "created_at": s.get("created_at"),
                 "message_count": len(s.get("chat_history", [])),
                 "is_complete": s.get("is_form_complete", False)
             }
-            for tid, s in _sessions.items()
+            for s in sessions
         ]
     }
@@ -5,10 +5,13 @@ CRUD operations for form configurations and templates.
 """
 
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from cachetools import LRUCache
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
 from app.models.form_config import (
@@ -22,12 +25,15 @@ from app.models.form_config import (
     TTSVoice,
 )
 from app.models.templates import TEMPLATES, get_template, list_templates
-from app.agents.dynamic_agent import clear_agent_cache
+from app.agents.dynamic_agent import DynamicAgent, get_or_create_agent, clear_agent_cache
 from app.services.persistence import (
     save_form_config as db_save_form_config,
     load_form_config as db_load_form_config,
-    list_form_configs as db_list_form_configs,
-    delete_form_config as db_delete_form_config,
+    asave_form_config as adb_save_form_config,
+    aload_form_config as adb_load_form_config,
+    aform_config_exists as adb_form_config_exists,
+    alist_form_configs_raw as adb_list_form_configs_raw,
+    adelete_form_config as adb_delete_form_config,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,7 +54,7 @@ class FieldCreate(BaseModel):
     required: bool = Field(default=True)
     options: Optional[List[str]] = Field(default=None)
     example: Optional[str] = Field(default=None)
-    order: int = Field(default=0)
+    order: Optional[int] = Field(default=None, description="Collection order (defaults to list position)")
 
 
 class BusinessProfileCreate(BaseModel):
@@ -110,61 +116,125 @@ class TemplateInfo(BaseModel):
 # Helper Functions
 # =============================================================================
 
-def _form_config_to_response(config: FormConfig) -> FormConfigResponse:
-    """Convert FormConfig to response model."""
-    return FormConfigResponse(
+# Enum lookups by value, built once instead of per field/request
+_FIELD_TYPE_MAP = {e.value: e for e in FieldType}
+_INDUSTRY_MAP = {e.value: e for e in Industry}
+_AGENT_TONE_MAP = {e.value: e for e in AgentTone}
+_TTS_VOICE_MAP = {e.value: e for e in TTSVoice}
+
+
+def _form_config_to_response(config: FormConfig, exclude_none: bool = False) -> FormConfigResponse:
+    """
+    Convert FormConfig to response model.
+    
+    The config is already validated, so the response is built with
+    model_construct rather than validated a second time.
+    
+    Args:
+        config: The form configuration
+        exclude_none: Omit null business/agent/field values
+    """
+    # Dump fields and count required ones in a single pass
+    fields = []
+    required_count = 0
+    for f in config.fields:
+        fields.append(f.model_dump(mode="json", exclude_none=exclude_none))
+        required_count += f.required
+    
+    return FormConfigResponse.model_construct(
         id=config.id,
         name=config.name,
-        business=config.business.model_dump(),
-        agent=config.agent.model_dump(),
-        fields=[f.model_dump() for f in config.fields],
+        business=config.business.model_dump(mode="json", exclude_none=exclude_none),
+        agent=config.agent.model_dump(mode="json", exclude_none=exclude_none),
+        fields=fields,
         created_at=config.created_at.isoformat(),
         updated_at=config.updated_at.isoformat(),
         is_active=config.is_active,
-        field_count=len(config.fields),
-        required_field_count=len([f for f in config.fields if f.required]),
+        field_count=len(fields),
+        required_field_count=required_count,
     )
 
 
-def _create_form_config(data: FormConfigCreate) -> FormConfig:
-    """Create FormConfig from request data."""
-    # Convert business profile
-    business = BusinessProfile(
-        name=data.business.name,
-        industry=Industry(data.business.industry) if data.business.industry in [e.value for e in Industry] else Industry.OTHER,
-        description=data.business.description,
+def _form_config_json(config: FormConfig, exclude_none: bool = False) -> Response:
+    """Serialize a FormConfig straight to a JSON response with pydantic's Rust serializer."""
+    return Response(
+        content=_form_config_to_response(config, exclude_none).model_dump_json(),
+        media_type="application/json",
     )
+
+
+def _drop_none(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop keys with null values from a dict."""
+    return {k: v for k, v in data.items() if v is not None}
+
+
+# Serialized get_form responses by (form_id, exclude_none), tagged with the
+# config's updated_at so a change made by another worker is still noticed
+_form_response_cache: LRUCache = LRUCache(maxsize=256)
+
+
+def _invalidate_form(form_id: str) -> None:
+    """
+    Drop cached agents, chat resolution and responses for a form after it changes.
     
-    # Convert agent config
-    agent_data = data.agent or AgentConfigCreate()
-    agent = AgentConfig(
-        name=agent_data.name,
-        tone=AgentTone(agent_data.tone) if agent_data.tone in [e.value for e in AgentTone] else AgentTone.PROFESSIONAL,
-        voice=TTSVoice(agent_data.voice) if agent_data.voice in [e.value for e in TTSVoice] else TTSVoice.NOVA,
-        custom_greeting=agent_data.custom_greeting,
-        custom_closing=agent_data.custom_closing,
+    Must run after the DB write has finished, not concurrently with it:
+    a chat request between the clear and the write would re-cache the
+    old config until the next change.
+    """
+    clear_agent_cache(form_id)
+    resolve_agent.cache_clear()
+    for exclude_none in (False, True):
+        _form_response_cache.pop((form_id, exclude_none), None)
+
+
+def _build_business(
+    data: BusinessProfileCreate,
+    default_industry: Industry = Industry.OTHER,
+) -> BusinessProfile:
+    """Build a BusinessProfile from request data, falling back on unknown industries."""
+    return BusinessProfile(
+        name=data.name,
+        industry=_INDUSTRY_MAP.get(data.industry, default_industry),
+        description=data.description,
     )
-    
-    # Convert fields
-    fields = []
-    for i, f in enumerate(data.fields):
-        field_type = FieldType(f.type) if f.type in [e.value for e in FieldType] else FieldType.TEXT
-        fields.append(FormField(
-            name=f.name,
-            label=f.label,
-            type=field_type,
-            description=f.description,
-            required=f.required,
-            options=f.options,
-            example=f.example,
-            order=f.order if f.order else i,
-        ))
-    
+
+
+def _build_agent(
+    data: AgentConfigCreate,
+    default_tone: AgentTone = AgentTone.PROFESSIONAL,
+    default_voice: TTSVoice = TTSVoice.NOVA,
+) -> AgentConfig:
+    """Build an AgentConfig from request data, falling back on unknown tones/voices."""
+    return AgentConfig(
+        name=data.name,
+        tone=_AGENT_TONE_MAP.get(data.tone, default_tone),
+        voice=_TTS_VOICE_MAP.get(data.voice, default_voice),
+        custom_greeting=data.custom_greeting,
+        custom_closing=data.custom_closing,
+    )
+
+
+def _build_field(i: int, f: FieldCreate) -> FormField:
+    """Build the i-th FormField from request data."""
+    return FormField(
+        name=f.name,
+        label=f.label,
+        type=_FIELD_TYPE_MAP.get(f.type, FieldType.TEXT),
+        description=f.description,
+        required=f.required,
+        options=f.options,
+        example=f.example,
+        order=f.order if f.order is not None else i,
+    )
+
+
+def _create_form_config(data: FormConfigCreate) -> FormConfig:
+    """Create FormConfig from request data."""
     return FormConfig(
         name=data.name,
-        business=business,
-        agent=agent,
-        fields=fields,
+        business=_build_business(data.business),
+        agent=_build_agent(data.agent or AgentConfigCreate()),
+        fields=[_build_field(i, f) for i, f in enumerate(data.fields)],
     )
 
 
@@ -172,35 +242,43 @@ def _create_form_config(data: FormConfigCreate) -> FormConfig:
 # Template Endpoints
 # =============================================================================
 
-@router.get("/templates", response_model=List[TemplateInfo])
+# Templates are static, so their responses are serialized once at import
+_TEMPLATES_JSON = orjson.dumps([
+    TemplateInfo(
+        id=t["id"],
+        name=t["name"],
+        industry=t["industry"],
+        field_count=t["field_count"],
+        description=t["description"],
+    ).model_dump()
+    for t in list_templates()
+])
+_TEMPLATE_RESPONSES: Dict[str, bytes] = {
+    industry: _form_config_to_response(template).model_dump_json().encode()
+    for industry, template in TEMPLATES.items()
+}
+_TEMPLATE_KEYS = list(TEMPLATES.keys())
+
+
+@router.get("/templates", responses={200: {"model": List[TemplateInfo]}})
 async def get_templates():
     """Get list of available industry templates."""
-    return [
-        TemplateInfo(
-            id=t["id"],
-            name=t["name"],
-            industry=t["industry"],
-            field_count=t["field_count"],
-            description=t["description"],
-        )
-        for t in list_templates()
-    ]
+    return Response(content=_TEMPLATES_JSON, media_type="application/json")
 
 
-@router.get("/templates/{industry}", response_model=FormConfigResponse)
+@router.get("/templates/{industry}", responses={200: {"model": FormConfigResponse}})
 async def get_template_by_industry(industry: str):
     """Get a specific industry template."""
-    try:
-        template = get_template(industry)
-        return _form_config_to_response(template)
-    except KeyError:
+    body = _TEMPLATE_RESPONSES.get(industry)
+    if body is None:
         raise HTTPException(
             status_code=404, 
-            detail=f"Template not found for industry: {industry}. Available: {list(TEMPLATES.keys())}"
+            detail=f"Template not found for industry: {industry}. Available: {_TEMPLATE_KEYS}"
         )
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/from-template/{industry}", response_model=FormConfigResponse)
+@router.post("/from-template/{industry}", responses={200: {"model": FormConfigResponse}})
 async def create_from_template(
     industry: str,
     business_name: str = Query(..., description="Your business name"),
@@ -213,19 +291,18 @@ async def create_from_template(
         # Customize with business name
         template.business.name = business_name
         template.id = None  # Will generate new ID
-        template.created_at = datetime.now()
-        template.updated_at = datetime.now()
+        template.created_at = template.updated_at = datetime.now()
         
         # Regenerate ID
         import uuid
         template.id = str(uuid.uuid4())
         
         # Save to database
-        db_save_form_config(template)
+        await adb_save_form_config(template)
         
         logger.info(f"Created form from template: {template.id} ({industry})")
         
-        return _form_config_to_response(template)
+        return _form_config_json(template)
         
     except KeyError:
         raise HTTPException(
@@ -238,38 +315,64 @@ async def create_from_template(
 # Form CRUD Endpoints
 # =============================================================================
 
-@router.get("/", response_model=List[FormConfigResponse])
-async def list_forms():
-    """List all form configurations."""
-    configs = db_list_form_configs(active_only=False)
-    return [_form_config_to_response(config) for config in configs]
+# Opt-in, since existing clients may rely on explicit nulls
+EXCLUDE_NONE_QUERY = Query(default=False, description="Omit null values to shrink the response")
 
 
-@router.post("/", response_model=FormConfigResponse)
+@router.get("/", responses={200: {"model": List[FormConfigResponse]}})
+async def list_forms(exclude_none: bool = EXCLUDE_NONE_QUERY):
+    """List all form configurations."""
+    forms = await adb_list_form_configs_raw(active_only=False)
+    for form in forms:
+        if exclude_none:
+            form["business"] = _drop_none(form["business"])
+            form["agent"] = _drop_none(form["agent"])
+        fields = form["fields"]
+        required_count = 0
+        for i, f in enumerate(fields):
+            required_count += f["required"]
+            if exclude_none:
+                fields[i] = _drop_none(f)
+        form["field_count"] = len(fields)
+        form["required_field_count"] = required_count
+    return Response(content=orjson.dumps(forms), media_type="application/json")
+
+
+@router.post("/", responses={200: {"model": FormConfigResponse}})
 async def create_form(data: FormConfigCreate):
     """Create a new form configuration."""
     config = _create_form_config(data)
-    db_save_form_config(config)
+    await adb_save_form_config(config)
     
     logger.info(f"Created form: {config.id} ({config.name})")
     
-    return _form_config_to_response(config)
+    return _form_config_json(config)
 
 
-@router.get("/{form_id}", response_model=FormConfigResponse)
-async def get_form(form_id: str):
+@router.get("/{form_id}", responses={200: {"model": FormConfigResponse}})
+async def get_form(form_id: str, exclude_none: bool = EXCLUDE_NONE_QUERY):
     """Get a form configuration by ID."""
-    config = db_load_form_config(form_id)
+    config = await adb_load_form_config(form_id)
     if not config:
         raise HTTPException(status_code=404, detail="Form not found")
     
-    return _form_config_to_response(config)
+    key = (form_id, exclude_none)
+    cached = _form_response_cache.get(key)
+    if cached is None or cached[0] != config.updated_at:
+        cached = (
+            config.updated_at,
+            _form_config_to_response(config, exclude_none).model_dump_json().encode(),
+        )
+        _form_response_cache[key] = cached
+    
+    return Response(content=cached[1], media_type="application/json")
 
 
-@router.put("/{form_id}", response_model=FormConfigResponse)
+@router.put("/{form_id}", responses={200: {"model": FormConfigResponse}})
 async def update_form(form_id: str, data: FormConfigUpdate):
     """Update a form configuration."""
-    config = db_load_form_config(form_id)
+    # Bypass the load cache so the write starts from the current row
+    config = await adb_load_form_config(form_id, use_cache=False)
     if not config:
         raise HTTPException(status_code=404, detail="Form not found")
     
@@ -278,59 +381,33 @@ async def update_form(form_id: str, data: FormConfigUpdate):
         config.name = data.name
     
     if data.business is not None:
-        config.business = BusinessProfile(
-            name=data.business.name,
-            industry=Industry(data.business.industry) if data.business.industry in [e.value for e in Industry] else config.business.industry,
-            description=data.business.description,
-        )
+        config.business = _build_business(data.business, config.business.industry)
     
     if data.agent is not None:
-        config.agent = AgentConfig(
-            name=data.agent.name,
-            tone=AgentTone(data.agent.tone) if data.agent.tone in [e.value for e in AgentTone] else config.agent.tone,
-            voice=TTSVoice(data.agent.voice) if data.agent.voice in [e.value for e in TTSVoice] else config.agent.voice,
-            custom_greeting=data.agent.custom_greeting,
-            custom_closing=data.agent.custom_closing,
-        )
+        config.agent = _build_agent(data.agent, config.agent.tone, config.agent.voice)
     
     if data.fields is not None:
-        fields = []
-        for i, f in enumerate(data.fields):
-            field_type = FieldType(f.type) if f.type in [e.value for e in FieldType] else FieldType.TEXT
-            fields.append(FormField(
-                name=f.name,
-                label=f.label,
-                type=field_type,
-                description=f.description,
-                required=f.required,
-                options=f.options,
-                example=f.example,
-                order=f.order if f.order else i,
-            ))
-        config.fields = fields
+        config.fields = [_build_field(i, f) for i, f in enumerate(data.fields)]
     
     config.updated_at = datetime.now()
     
-    # Save to database
-    db_save_form_config(config)
-    
-    # Clear agent cache so it rebuilds with new config
-    clear_agent_cache(form_id)
+    # Save to database, then clear caches so the agent rebuilds with new config
+    await adb_save_form_config(config)
+    _invalidate_form(form_id)
     
     logger.info(f"Updated form: {form_id}")
     
-    return _form_config_to_response(config)
+    return _form_config_json(config)
 
 
 @router.delete("/{form_id}")
 async def delete_form(form_id: str):
     """Delete a form configuration."""
-    config = db_load_form_config(form_id)
-    if not config:
+    if not await adb_form_config_exists(form_id):
         raise HTTPException(status_code=404, detail="Form not found")
     
-    db_delete_form_config(form_id)
-    clear_agent_cache(form_id)
+    await adb_delete_form_config(form_id)
+    _invalidate_form(form_id)
     
     logger.info(f"Deleted form: {form_id}")
     
@@ -341,67 +418,77 @@ async def delete_form(form_id: str):
 # Field Type Info
 # =============================================================================
 
+# Static metadata, serialized once at import
+_FIELD_TYPES_JSON = orjson.dumps([
+    {"value": "text", "label": "Short Text", "description": "Single line text input"},
+    {"value": "textarea", "label": "Long Text", "description": "Multi-line text input"},
+    {"value": "number", "label": "Number", "description": "Numeric value"},
+    {"value": "date", "label": "Date", "description": "Date picker"},
+    {"value": "time", "label": "Time", "description": "Time picker"},
+    {"value": "datetime", "label": "Date & Time", "description": "Date and time picker"},
+    {"value": "email", "label": "Email", "description": "Email address with validation"},
+    {"value": "phone", "label": "Phone", "description": "Phone number"},
+    {"value": "select", "label": "Dropdown", "description": "Single selection from options"},
+    {"value": "multiselect", "label": "Multi-Select", "description": "Multiple selections from options"},
+    {"value": "boolean", "label": "Yes/No", "description": "True or false question"},
+    {"value": "address", "label": "Address", "description": "Full address input"},
+    {"value": "name", "label": "Full Name", "description": "Person's full name"},
+    {"value": "currency", "label": "Currency", "description": "Dollar amount"},
+])
+
+_INDUSTRIES_JSON = orjson.dumps([
+    {"value": "legal", "label": "Legal Services"},
+    {"value": "healthcare", "label": "Healthcare"},
+    {"value": "real_estate", "label": "Real Estate"},
+    {"value": "home_services", "label": "Home Services"},
+    {"value": "recruiting", "label": "Recruiting"},
+    {"value": "financial", "label": "Financial Services"},
+    {"value": "insurance", "label": "Insurance"},
+    {"value": "education", "label": "Education"},
+    {"value": "hospitality", "label": "Hospitality"},
+    {"value": "other", "label": "Other"},
+])
+
+_TONES_JSON = orjson.dumps([
+    {"value": "professional", "label": "Professional", "description": "Business-like and courteous"},
+    {"value": "friendly", "label": "Friendly", "description": "Warm and approachable"},
+    {"value": "empathetic", "label": "Empathetic", "description": "Understanding and supportive"},
+    {"value": "formal", "label": "Formal", "description": "Precise and respectful"},
+    {"value": "casual", "label": "Casual", "description": "Relaxed and conversational"},
+])
+
+_VOICES_JSON = orjson.dumps([
+    {"value": "alloy", "label": "Alloy", "description": "Neutral, balanced voice"},
+    {"value": "echo", "label": "Echo", "description": "Male, warm voice"},
+    {"value": "fable", "label": "Fable", "description": "British, expressive voice"},
+    {"value": "onyx", "label": "Onyx", "description": "Male, deep voice"},
+    {"value": "nova", "label": "Nova", "description": "Female, friendly voice"},
+    {"value": "shimmer", "label": "Shimmer", "description": "Female, soft voice"},
+])
+
+
 @router.get("/meta/field-types")
 async def get_field_types():
     """Get available field types with descriptions."""
-    return [
-        {"value": "text", "label": "Short Text", "description": "Single line text input"},
-        {"value": "textarea", "label": "Long Text", "description": "Multi-line text input"},
-        {"value": "number", "label": "Number", "description": "Numeric value"},
-        {"value": "date", "label": "Date", "description": "Date picker"},
-        {"value": "time", "label": "Time", "description": "Time picker"},
-        {"value": "datetime", "label": "Date & Time", "description": "Date and time picker"},
-        {"value": "email", "label": "Email", "description": "Email address with validation"},
-        {"value": "phone", "label": "Phone", "description": "Phone number"},
-        {"value": "select", "label": "Dropdown", "description": "Single selection from options"},
-        {"value": "multiselect", "label": "Multi-Select", "description": "Multiple selections from options"},
-        {"value": "boolean", "label": "Yes/No", "description": "True or false question"},
-        {"value": "address", "label": "Address", "description": "Full address input"},
-        {"value": "name", "label": "Full Name", "description": "Person's full name"},
-        {"value": "currency", "label": "Currency", "description": "Dollar amount"},
-    ]
+    return Response(content=_FIELD_TYPES_JSON, media_type="application/json")
 
 
 @router.get("/meta/industries")
 async def get_industries():
     """Get available industries."""
-    return [
-        {"value": "legal", "label": "Legal Services"},
-        {"value": "healthcare", "label": "Healthcare"},
-        {"value": "real_estate", "label": "Real Estate"},
-        {"value": "home_services", "label": "Home Services"},
-        {"value": "recruiting", "label": "Recruiting"},
-        {"value": "financial", "label": "Financial Services"},
-        {"value": "insurance", "label": "Insurance"},
-        {"value": "education", "label": "Education"},
-        {"value": "hospitality", "label": "Hospitality"},
-        {"value": "other", "label": "Other"},
-    ]
+    return Response(content=_INDUSTRIES_JSON, media_type="application/json")
 
 
 @router.get("/meta/tones")
 async def get_tones():
     """Get available agent tones."""
-    return [
-        {"value": "professional", "label": "Professional", "description": "Business-like and courteous"},
-        {"value": "friendly", "label": "Friendly", "description": "Warm and approachable"},
-        {"value": "empathetic", "label": "Empathetic", "description": "Understanding and supportive"},
-        {"value": "formal", "label": "Formal", "description": "Precise and respectful"},
-        {"value": "casual", "label": "Casual", "description": "Relaxed and conversational"},
-    ]
+    return Response(content=_TONES_JSON, media_type="application/json")
 
 
 @router.get("/meta/voices")
 async def get_voices():
     """Get available TTS voices."""
-    return [
-        {"value": "alloy", "label": "Alloy", "description": "Neutral, balanced voice"},
-        {"value": "echo", "label": "Echo", "description": "Male, warm voice"},
-        {"value": "fable", "label": "Fable", "description": "British, expressive voice"},
-        {"value": "onyx", "label": "Onyx", "description": "Male, deep voice"},
-        {"value": "nova", "label": "Nova", "description": "Female, friendly voice"},
-        {"value": "shimmer", "label": "Shimmer", "description": "Female, soft voice"},
-    ]
+    return Response(content=_VOICES_JSON, media_type="application/json")
 
 
 # =============================================================================
@@ -429,3 +516,32 @@ def get_or_create_demo_config() -> FormConfig:
     db_save_form_config(template)
     
     return template
+
+
+@lru_cache(maxsize=1024)
+def resolve_agent(form_id: Optional[str] = None) -> tuple[FormConfig, DynamicAgent]:
+    """
+    Resolve the form config and agent for a chat request (for internal use).
+    
+    Memoized per form_id; call ``resolve_agent.cache_clear()`` whenever a
+    form is updated or deleted. Blocking on a cache miss (loads from
+    SQLite), so call via ``asyncio.to_thread``.
+    
+    Args:
+        form_id: Form configuration ID, or None for the demo config
+        
+    Returns:
+        Tuple of (form config, agent)
+        
+    Raises:
+        KeyError: If form_id doesn't exist (not cached, so a form created
+            later is picked up)
+    """
+    if form_id:
+        form_config = get_form_config(form_id)
+        if not form_config:
+            raise KeyError(form_id)
+    else:
+        form_config = get_or_create_demo_config()
+    
+    return form_config, get_or_create_agent(form_config)
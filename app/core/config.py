@@ -6,10 +6,10 @@ Designed for easy customization without code changes.
 """
 
 import os
-from typing import Optional, List
+from typing import Final, Optional, List, Tuple
 from pydantic import Field
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache, cached_property
 
 
 class Settings(BaseSettings):
@@ -67,8 +67,10 @@ class Settings(BaseSettings):
     # Session & Persistence
     # ===========================================
     session_timeout_minutes: int = Field(default=30, description="Session timeout in minutes")
+    max_sessions: int = Field(default=10_000, description="Max in-memory chat sessions before LRU eviction")
     persistence_enabled: bool = Field(default=True, description="Enable conversation persistence")
     database_url: Optional[str] = Field(default=None, description="Database URL for persistence (SQLite by default)")
+    redis_url: Optional[str] = Field(default=None, description="Redis URL for shared chat sessions (in-memory if not set)")
     
     # ===========================================
     # Performance Settings
@@ -77,6 +79,10 @@ class Settings(BaseSettings):
     request_timeout: int = Field(default=30, description="Request timeout in seconds")
     enable_caching: bool = Field(default=True, description="Enable response caching")
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
+    enable_semantic_cache: bool = Field(default=False, description="Replay cached responses to content-free replies (confirmations, acknowledgements)")
+    embedding_model: str = Field(default="text-embedding-3-small", description="Embedding model for the semantic response cache")
+    semantic_cache_threshold: float = Field(default=0.95, description="Min cosine similarity for a semantic cache hit")
+    enable_prefetch: bool = Field(default=False, description="Predict and pre-render the next voice turn in the background")
     
     # ===========================================
     # Observability
@@ -85,20 +91,23 @@ class Settings(BaseSettings):
     langsmith_project: str = Field(default="notera-ai", description="LangSmith project name")
     enable_tracing: bool = Field(default=False, description="Enable LangSmith tracing")
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    # Frozen: settings are read-only after load and shared across threads
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins string into list."""
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Parse CORS origins string into a tuple (parsed once)."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(",") if origin.strip())
     
-    @property
-    def supported_languages_list(self) -> List[str]:
-        """Parse supported languages string into list."""
-        return [lang.strip() for lang in self.supported_languages.split(",") if lang.strip()]
+    @cached_property
+    def supported_languages_list(self) -> Tuple[str, ...]:
+        """Parse supported languages string into a tuple (parsed once)."""
+        return tuple(lang.strip() for lang in self.supported_languages.split(",") if lang.strip())
     
     @property
     def is_production(self) -> bool:
@@ -135,4 +144,4 @@ def get_settings() -> Settings:
 
 
 # Global settings instance
-settings = get_settings()
+settings: Final[Settings] = get_settings()
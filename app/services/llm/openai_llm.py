@@ -71,6 +71,7 @@ class OpenAILLM:
                 api_key=self.api_key,
                 max_retries=settings.max_retries,
                 request_timeout=settings.request_timeout,
+                streaming=True,
             )
         
         return self._llm
@@ -10,10 +10,19 @@ from .form_storage import (
     init_form_database,
     save_form_config,
     load_form_config,
+    form_config_exists,
     list_form_configs,
+    list_form_configs_raw,
     delete_form_config,
     count_form_configs,
+    asave_form_config,
+    aload_form_config,
+    aform_config_exists,
+    alist_form_configs_raw,
+    adelete_form_config,
 )
+from .session_store import SessionStore, RedisSessionStore, get_session_store
+from .audio_store import AudioStore, RedisAudioStore, get_audio_store
 
 __all__ = [
     # Conversation persistence
@@ -26,7 +35,22 @@ __all__ = [
     "init_form_database",
     "save_form_config",
     "load_form_config",
+    "form_config_exists",
     "list_form_configs",
+    "list_form_configs_raw",
     "delete_form_config",
     "count_form_configs",
+    "asave_form_config",
+    "aload_form_config",
+    "aform_config_exists",
+    "alist_form_configs_raw",
+    "adelete_form_config",
+    # Chat session storage
+    "SessionStore",
+    "RedisSessionStore",
+    "get_session_store",
+    # TTS audio storage
+    "AudioStore",
+    "RedisAudioStore",
+    "get_audio_store",
 ]
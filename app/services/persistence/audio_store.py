@@ -0,0 +1,85 @@
+"""
+TTS Audio Storage
+
+Short-lived storage for synthesized audio, so clients can fetch it as
+binary from /api/chat/audio/{id} instead of receiving it base64 encoded
+in the JSON response. Uses Redis when REDIS_URL is configured.
+"""
+
+import time
+import uuid
+import logging
+from typing import Optional, Dict, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for audio clips
+AUDIO_KEY_PREFIX = "audio:"
+
+# Seconds a clip stays fetchable after synthesis
+AUDIO_TTL_SECONDS = 120
+
+
+class AudioStore:
+    """In-process audio store with expiry."""
+
+    def __init__(self, ttl_seconds: int = AUDIO_TTL_SECONDS):
+        self._ttl = ttl_seconds
+        self._clips: Dict[str, Tuple[float, bytes]] = {}
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for audio_id in [k for k, (expires, _) in self._clips.items() if expires <= now]:
+            del self._clips[audio_id]
+
+    async def put(self, audio: bytes) -> str:
+        """Store an audio clip and return its ID."""
+        self._evict_expired()
+        audio_id = uuid.uuid4().hex
+        self._clips[audio_id] = (time.monotonic() + self._ttl, audio)
+        return audio_id
+
+    async def get(self, audio_id: str) -> Optional[bytes]:
+        """Get an audio clip, or None if it doesn't exist or has expired."""
+        entry = self._clips.get(audio_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+
+class RedisAudioStore(AudioStore):
+    """Redis-backed audio store, so any worker can serve the clip."""
+
+    def __init__(self, url: str, ttl_seconds: int = AUDIO_TTL_SECONDS):
+        # Imported lazily so redis is only required when configured
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._ttl = ttl_seconds
+
+    async def put(self, audio: bytes) -> str:
+        """Store an audio clip and return its ID."""
+        audio_id = uuid.uuid4().hex
+        await self._redis.setex(AUDIO_KEY_PREFIX + audio_id, self._ttl, audio)
+        return audio_id
+
+    async def get(self, audio_id: str) -> Optional[bytes]:
+        """Get an audio clip, or None if it doesn't exist or has expired."""
+        return await self._redis.get(AUDIO_KEY_PREFIX + audio_id)
+
+
+# Singleton instance
+_audio_store: Optional[AudioStore] = None
+
+
+def get_audio_store() -> AudioStore:
+    """Get or create the audio store singleton."""
+    global _audio_store
+    if _audio_store is None:
+        if settings.redis_url:
+            _audio_store = RedisAudioStore(settings.redis_url)
+        else:
+            _audio_store = AudioStore()
+    return _audio_store
@@ -4,13 +4,21 @@ Form Configuration Storage
 SQLite-based persistence for form configurations.
 """
 
+import asyncio
 import logging
-import json
+import queue
+import uuid
 import sqlite3
-from typing import Optional, List, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 
+import orjson
+from cachetools import LRUCache
+
 from app.models.form_config import (
     FormConfig,
     FormField,
@@ -27,152 +35,302 @@ logger = logging.getLogger(__name__)
 # Database path
 DB_PATH = Path("./data/notera.db")
 
+# Max idle connections kept for reuse
+POOL_SIZE = 8
+
+# Idle connections; LIFO so the most recently used (hottest page cache) is reused first
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
+# Loaded configs kept in memory, by ID
+LOAD_CACHE_SIZE = 256
+
+# Configs are cached with the updated_at they were loaded at, and handed
+# out as copies since callers may modify them. A hit is checked against
+# the row's current updated_at, so writes from other workers are noticed.
+# Writes bump the epoch, so a load that raced a write doesn't cache what
+# it read.
+_load_cache: LRUCache = LRUCache(maxsize=LOAD_CACHE_SIZE)
+_load_cache_lock = threading.Lock()
+_load_epoch = 0
+
+# Bytes of the database file memory-mapped per connection
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+CACHED_STATEMENTS = 256
+
+# Columns read back, in the order the row converters unpack them
+CONFIG_COLUMNS = (
+    "id, name, business_name, business_industry, business_description, business_website, "
+    "agent_name, agent_tone, agent_voice, agent_custom_greeting, agent_custom_closing, "
+    "is_active, created_at, updated_at"
+)
+FIELD_COLUMNS = (
+    "form_config_id, name, label, type, description, required, options, example, field_order"
+)
+
+# SQL used on every call. sqlite3 caches prepared statements by SQL text,
+# so each is written once here and reused verbatim.
+SQL_CONFIG_EXISTS = "SELECT 1 FROM form_configs WHERE id = ? LIMIT 1"
+SQL_SELECT_UPDATED_AT = "SELECT updated_at FROM form_configs WHERE id = ?"
+SQL_SELECT_BY_ID = f"SELECT {CONFIG_COLUMNS} FROM form_configs WHERE id = ?"
+SQL_SELECT_FIELDS = (
+    f"SELECT {FIELD_COLUMNS} FROM form_fields WHERE form_config_id = ? ORDER BY field_order, id"
+)
+SQL_LIST_ACTIVE = (
+    f"SELECT {CONFIG_COLUMNS} FROM form_configs WHERE is_active = 1 "
+    "ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+)
+SQL_LIST_ALL = f"SELECT {CONFIG_COLUMNS} FROM form_configs ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+SQL_COUNT_ACTIVE = "SELECT COUNT(*) FROM form_configs WHERE is_active = 1"
+SQL_COUNT_ALL = "SELECT COUNT(*) FROM form_configs"
+SQL_DELETE_FIELDS = "DELETE FROM form_fields WHERE form_config_id = ?"
+SQL_DELETE_CONFIG = "DELETE FROM form_configs WHERE id = ?"
+
+# Insert, or update an existing config in place. created_at is kept on
+# update and updated_at is bound separately (the last parameter).
+SQL_UPSERT_CONFIG = """
+    INSERT INTO form_configs (
+        id, name, business_name, business_industry, business_description,
+        business_phone, business_email, business_website, agent_name,
+        agent_tone, agent_voice, agent_custom_greeting, agent_custom_closing,
+        is_active, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name, business_name = excluded.business_name,
+        business_industry = excluded.business_industry,
+        business_description = excluded.business_description,
+        business_phone = excluded.business_phone, business_email = excluded.business_email,
+        business_website = excluded.business_website, agent_name = excluded.agent_name,
+        agent_tone = excluded.agent_tone, agent_voice = excluded.agent_voice,
+        agent_custom_greeting = excluded.agent_custom_greeting,
+        agent_custom_closing = excluded.agent_custom_closing,
+        is_active = excluded.is_active, updated_at = ?
+"""
+
+SQL_INSERT_FIELD = """
+    INSERT INTO form_fields (
+        form_config_id, name, label, type, description,
+        required, options, example, field_order
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a new database connection, configured once for its lifetime."""
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+        isolation_level=None,  # autocommit; writes use explicit transactions
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20MB
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
+
+
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a pooled database connection.
+    
+    Connections are shared across threads, but each is only used by one
+    caller at a time. Any transaction left open (e.g. after an error) is
+    rolled back before the connection goes back to the pool.
+    """
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block of writes as one transaction.
+    
+    Takes the write lock up front (BEGIN IMMEDIATE), commits on success
+    and rolls back on error.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
 
 def init_form_database() -> None:
     """Initialize the SQLite database with form configuration tables."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     
-    conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
-    
-    # Create form_configs table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS form_configs (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            business_name TEXT NOT NULL,
-            business_industry TEXT DEFAULT 'other',
-            business_description TEXT,
-            business_phone TEXT,
-            business_email TEXT,
-            business_website TEXT,
-            agent_name TEXT DEFAULT 'Alex',
-            agent_tone TEXT DEFAULT 'professional',
-            agent_voice TEXT DEFAULT 'nova',
-            agent_custom_greeting TEXT,
-            agent_custom_closing TEXT,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Create form_fields table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS form_fields (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            form_config_id TEXT NOT NULL,
-            name TEXT NOT NULL,
-            label TEXT NOT NULL,
-            type TEXT DEFAULT 'text',
-            description TEXT,
-            required BOOLEAN DEFAULT 1,
-            options TEXT,
-            example TEXT,
-            field_order INTEGER DEFAULT 0,
-            FOREIGN KEY (form_config_id) REFERENCES form_configs(id) ON DELETE CASCADE
+    with get_conn() as conn, transaction(conn):
+        cursor = conn.cursor()
+        
+        # Create form_configs table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS form_configs (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                business_name TEXT NOT NULL,
+                business_industry TEXT DEFAULT 'other',
+                business_description TEXT,
+                business_phone TEXT,
+                business_email TEXT,
+                business_website TEXT,
+                agent_name TEXT DEFAULT 'Alex',
+                agent_tone TEXT DEFAULT 'professional',
+                agent_voice TEXT DEFAULT 'nova',
+                agent_custom_greeting TEXT,
+                agent_custom_closing TEXT,
+                is_active BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Create form_fields table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS form_fields (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                form_config_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                label TEXT NOT NULL,
+                type TEXT DEFAULT 'text',
+                description TEXT,
+                required BOOLEAN DEFAULT 1,
+                options TEXT,
+                example TEXT,
+                field_order INTEGER DEFAULT 0,
+                FOREIGN KEY (form_config_id) REFERENCES form_configs(id) ON DELETE CASCADE
+            )
+        """)
+        
+        # Create indexes
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_form_config_id ON form_fields(form_config_id)")
+        # Cover the list queries' filter and sort, so pages stream in index order.
+        # Counts are answered from these indexes alone, without the table.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_form_active_updated "
+            "ON form_configs(is_active, updated_at DESC)"
         )
-    """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_form_updated ON form_configs(updated_at DESC)")
+        # Superseded by idx_form_active_updated, which has is_active as its prefix
+        cursor.execute("DROP INDEX IF EXISTS idx_form_active")
     
-    # Create indexes
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_form_config_id ON form_fields(form_config_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_form_active ON form_configs(is_active)")
+    logger.info("Form database initialized at %s", DB_PATH)
+
+
+def _enum_val(value: Any, default: Optional[str] = None) -> Optional[str]:
+    """Get the stored value of a field that could be an enum, a string or None."""
+    if isinstance(value, Enum):
+        return value.value
+    return value if value is not None else default
+
+
+def _form_config_to_row(config: FormConfig, now_iso: Optional[str] = None) -> Tuple:
+    """
+    Convert FormConfig to SQL_UPSERT_CONFIG parameters, in order.
     
-    conn.commit()
-    conn.close()
+    Missing timestamps default to now_iso, which is also the updated_at
+    set when the config already exists.
+    """
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
     
-    logger.info(f"Form database initialized at {DB_PATH}")
+    business = config.business
+    agent = config.agent
+    return (
+        config.id,
+        config.name,
+        business.name,
+        _enum_val(business.industry, "other"),
+        business.description,
+        getattr(business, 'phone', None),
+        getattr(business, 'email', None),
+        getattr(business, 'website', None),
+        agent.name,
+        _enum_val(agent.tone, "professional"),
+        _enum_val(agent.voice, "nova"),
+        agent.custom_greeting,
+        agent.custom_closing,
+        config.is_active,
+        config.created_at.isoformat() if config.created_at else now_iso,
+        config.updated_at.isoformat() if config.updated_at else now_iso,
+        now_iso,
+    )
 
 
-def _form_config_to_dict(config: FormConfig) -> Dict[str, Any]:
-    """Convert FormConfig to database-friendly dict."""
-    # Handle industry - could be enum or string
-    industry = config.business.industry
-    if hasattr(industry, 'value'):
-        industry = industry.value
-    elif industry is None:
-        industry = "other"
+def _row_to_form_config(row: Tuple, fields: List[Tuple]) -> FormConfig:
+    """
+    Convert database row to FormConfig.
     
-    # Handle tone - could be enum or string
-    tone = config.agent.tone
-    if hasattr(tone, 'value'):
-        tone = tone.value
-    elif tone is None:
-        tone = "professional"
+    Fields must already be sorted by order; the queries do this.
     
-    # Handle voice - could be enum or string
-    voice = config.agent.voice
-    if hasattr(voice, 'value'):
-        voice = voice.value
-    elif voice is None:
-        voice = "nova"
+    Rows were validated when saved, so models are built with model_construct
+    and skip validation. Enums are stored as their values, as the models'
+    use_enum_values would.
+    """
+    (
+        config_id, name, business_name, industry, business_description, website,
+        agent_name, tone, voice, custom_greeting, custom_closing,
+        is_active, created_at, updated_at,
+    ) = row
     
-    return {
-        "id": config.id,
-        "name": config.name,
-        "business_name": config.business.name,
-        "business_industry": industry,
-        "business_description": config.business.description,
-        "business_phone": getattr(config.business, 'phone', None),
-        "business_email": getattr(config.business, 'email', None),
-        "business_website": getattr(config.business, 'website', None),
-        "agent_name": config.agent.name,
-        "agent_tone": tone,
-        "agent_voice": voice,
-        "agent_custom_greeting": config.agent.custom_greeting,
-        "agent_custom_closing": config.agent.custom_closing,
-        "is_active": config.is_active,
-        "created_at": config.created_at.isoformat() if config.created_at else datetime.now().isoformat(),
-        "updated_at": config.updated_at.isoformat() if config.updated_at else datetime.now().isoformat(),
-    }
-
-
-def _row_to_form_config(row: sqlite3.Row, fields: List[sqlite3.Row]) -> FormConfig:
-    """Convert database row to FormConfig."""
     # Build business profile
-    business = BusinessProfile(
-        name=row["business_name"],
-        industry=Industry(row["business_industry"]) if row["business_industry"] else Industry.OTHER,
-        description=row["business_description"],
-        website=row["business_website"],
+    business = BusinessProfile.model_construct(
+        name=business_name,
+        industry=industry or Industry.OTHER.value,
+        description=business_description,
+        website=website,
     )
     
     # Build agent config
-    agent = AgentConfig(
-        name=row["agent_name"] or "Alex",
-        tone=AgentTone(row["agent_tone"]) if row["agent_tone"] else AgentTone.PROFESSIONAL,
-        voice=TTSVoice(row["agent_voice"]) if row["agent_voice"] else TTSVoice.NOVA,
-        custom_greeting=row["agent_custom_greeting"],
-        custom_closing=row["agent_custom_closing"],
+    agent = AgentConfig.model_construct(
+        name=agent_name or "Alex",
+        tone=tone or AgentTone.PROFESSIONAL.value,
+        voice=voice or TTSVoice.NOVA.value,
+        custom_greeting=custom_greeting,
+        custom_closing=custom_closing,
     )
     
     # Build fields
     form_fields = []
-    for f in fields:
-        options = json.loads(f["options"]) if f["options"] else None
-        form_fields.append(FormField(
-            name=f["name"],
-            label=f["label"],
-            type=FieldType(f["type"]) if f["type"] else FieldType.TEXT,
-            description=f["description"],
-            required=bool(f["required"]),
-            options=options,
-            example=f["example"],
-            order=f["field_order"] or 0,
+    for _, f_name, label, f_type, description, required, options, example, order in fields:
+        form_fields.append(FormField.model_construct(
+            name=f_name,
+            label=label,
+            type=f_type or FieldType.TEXT.value,
+            description=description,
+            required=bool(required),
+            options=orjson.loads(options) if options else None,
+            example=example,
+            order=order or 0,
         ))
     
-    # Sort fields by order
-    form_fields.sort(key=lambda x: x.order)
-    
-    return FormConfig(
-        id=row["id"],
-        name=row["name"],
+    return FormConfig.model_construct(
+        id=config_id,
+        name=name,
         business=business,
         agent=agent,
         fields=form_fields,
-        is_active=bool(row["is_active"]),
-        created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
-        updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else datetime.now(),
+        is_active=bool(is_active),
+        created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else datetime.now(),
     )
 
 
@@ -187,116 +345,125 @@ def save_form_config(config: FormConfig) -> bool:
         True if successful
     """
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-        
-        data = _form_config_to_dict(config)
-        
-        # Check if exists
-        cursor.execute("SELECT id FROM form_configs WHERE id = ?", (config.id,))
-        exists = cursor.fetchone() is not None
-        
-        if exists:
-            # Update
-            cursor.execute("""
-                UPDATE form_configs SET
-                    name = ?, business_name = ?, business_industry = ?,
-                    business_description = ?, business_phone = ?, business_email = ?,
-                    business_website = ?, agent_name = ?, agent_tone = ?,
-                    agent_voice = ?, agent_custom_greeting = ?, agent_custom_closing = ?,
-                    is_active = ?, updated_at = ?
-                WHERE id = ?
-            """, (
-                data["name"], data["business_name"], data["business_industry"],
-                data["business_description"], data["business_phone"], data["business_email"],
-                data["business_website"], data["agent_name"], data["agent_tone"],
-                data["agent_voice"], data["agent_custom_greeting"], data["agent_custom_closing"],
-                data["is_active"], datetime.now().isoformat(), config.id
-            ))
+        with get_conn() as conn, transaction(conn):
+            cursor = conn.cursor()
             
-            # Delete existing fields
-            cursor.execute("DELETE FROM form_fields WHERE form_config_id = ?", (config.id,))
-        else:
-            # Insert
-            cursor.execute("""
-                INSERT INTO form_configs (
-                    id, name, business_name, business_industry, business_description,
-                    business_phone, business_email, business_website, agent_name,
-                    agent_tone, agent_voice, agent_custom_greeting, agent_custom_closing,
-                    is_active, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                config.id, data["name"], data["business_name"], data["business_industry"],
-                data["business_description"], data["business_phone"], data["business_email"],
-                data["business_website"], data["agent_name"], data["agent_tone"],
-                data["agent_voice"], data["agent_custom_greeting"], data["agent_custom_closing"],
-                data["is_active"], data["created_at"], data["updated_at"]
-            ))
-        
-        # Insert fields
-        for field in config.fields:
-            options_json = json.dumps(field.options) if field.options else None
-            # Handle field.type - could be enum or string
-            field_type = field.type.value if hasattr(field.type, 'value') else field.type
-            cursor.execute("""
-                INSERT INTO form_fields (
-                    form_config_id, name, label, type, description,
-                    required, options, example, field_order
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                config.id, field.name, field.label, field_type,
-                field.description, field.required, options_json,
-                field.example, field.order
-            ))
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"Saved form config: {config.id} ({config.name})")
+            # Insert or update
+            cursor.execute(SQL_UPSERT_CONFIG, _form_config_to_row(config))
+            
+            # Replace existing fields
+            cursor.execute(SQL_DELETE_FIELDS, (config.id,))
+            
+            # Insert fields in one batch
+            cursor.executemany(SQL_INSERT_FIELD, [
+                (
+                    config.id, field.name, field.label,
+                    _enum_val(field.type),
+                    field.description, field.required,
+                    orjson.dumps(field.options).decode() if field.options else None,
+                    field.example, field.order,
+                )
+                for field in config.fields
+            ])
+        
+        _invalidate_loaded(config.id)
+        logger.info("Saved form config: %s (%s)", config.id, config.name)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to save form config: {e}")
+        logger.error("Failed to save form config: %s", e)
         return False
 
 
-def load_form_config(config_id: str) -> Optional[FormConfig]:
+def _invalidate_loaded(config_id: str) -> None:
+    """Drop a config from the load cache after it is written."""
+    global _load_epoch
+    with _load_cache_lock:
+        _load_epoch += 1
+        _load_cache.pop(config_id, None)
+
+
+def load_form_config(config_id: str, use_cache: bool = True) -> Optional[FormConfig]:
     """
     Load a form configuration by ID.
     
+    Memoized: a cached config is reused while its updated_at in the
+    database is unchanged, which costs one indexed lookup. Each call gets
+    its own copy.
+    
     Args:
         config_id: Form configuration ID
+        use_cache: Set False to always read the full config from the
+            database, e.g. before modifying and saving it
         
     Returns:
         FormConfig or None if not found
     """
+    with _load_cache_lock:
+        cached = _load_cache.get(config_id) if use_cache else None
+        epoch = _load_epoch
+    
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            
+            # Reuse the cached config if it hasn't changed since it was loaded
+            if cached is not None:
+                stamp = cursor.execute(SQL_SELECT_UPDATED_AT, (config_id,)).fetchone()
+                if stamp is not None and stamp[0] == cached[0]:
+                    return cached[1].model_copy(deep=True)
+            
+            # Get config
+            cursor.execute(SQL_SELECT_BY_ID, (config_id,))
+            row = cursor.fetchone()
+            
+            if not row:
+                with _load_cache_lock:
+                    _load_cache.pop(config_id, None)
+                return None
+            
+            # Get fields
+            cursor.execute(SQL_SELECT_FIELDS, (config_id,))
+            fields = cursor.fetchall()
         
-        # Get config
-        cursor.execute("SELECT * FROM form_configs WHERE id = ?", (config_id,))
-        row = cursor.fetchone()
+        config = _row_to_form_config(row, fields)
+        with _load_cache_lock:
+            if epoch == _load_epoch:
+                _load_cache[config_id] = (row[-1], config)
+        return config.model_copy(deep=True)
         
-        if not row:
-            conn.close()
-            return None
+    except Exception as e:
+        logger.error("Failed to load form config: %s", e)
+        return None
+
+
+def form_config_exists(config_id: str) -> bool:
+    """Check whether a form configuration exists, without loading it."""
+    try:
+        with get_conn() as conn:
+            return conn.execute(SQL_CONFIG_EXISTS, (config_id,)).fetchone() is not None
         
-        # Get fields
+    except Exception as e:
+        logger.error("Failed to check form config: %s", e)
+        return False
+
+
+def _fetch_fields_by_config(
+    cursor: sqlite3.Cursor,
+    config_ids: List[str]
+) -> Dict[str, List[Tuple]]:
+    """Get the fields for several configs in one query, grouped by config ID."""
+    fields_by_config: Dict[str, List[Tuple]] = {config_id: [] for config_id in config_ids}
+    if config_ids:
+        placeholders = ",".join("?" * len(config_ids))
         cursor.execute(
-            "SELECT * FROM form_fields WHERE form_config_id = ? ORDER BY field_order",
-            (config_id,)
+            f"SELECT {FIELD_COLUMNS} FROM form_fields WHERE form_config_id IN ({placeholders}) "
+            "ORDER BY field_order, id",
+            config_ids,
         )
-        fields = cursor.fetchall()
-        
-        conn.close()
-        
-        return _row_to_form_config(row, fields)
-        
-    except Exception as e:
-        logger.error(f"Failed to load form config: {e}")
-        return None
+        for f in cursor:
+            fields_by_config[f[0]].append(f)
+    return fields_by_config
 
 
 def list_form_configs(
@@ -316,37 +483,100 @@ def list_form_configs(
         List of FormConfig objects
     """
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM form_configs"
-        params = []
-        
-        if active_only:
-            query += " WHERE is_active = 1"
-        
-        query += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            
+            query = SQL_LIST_ACTIVE if active_only else SQL_LIST_ALL
+            cursor.execute(query, (limit, offset))
+            rows = cursor.fetchall()
+            
+            fields_by_config = _fetch_fields_by_config(cursor, [row[0] for row in rows])
+            return [_row_to_form_config(row, fields_by_config[row[0]]) for row in rows]
         
-        configs = []
-        for row in rows:
-            # Get fields for each config
-            cursor.execute(
-                "SELECT * FROM form_fields WHERE form_config_id = ? ORDER BY field_order",
-                (row["id"],)
-            )
-            fields = cursor.fetchall()
-            configs.append(_row_to_form_config(row, fields))
+    except Exception as e:
+        logger.error("Failed to list form configs: %s", e)
+        return []
+
+
+def _row_to_form_dict(row: Tuple, fields: List[Tuple]) -> Dict[str, Any]:
+    """Convert database rows straight to a FormConfig-shaped JSON dict, without validation."""
+    (
+        config_id, name, business_name, industry, business_description, website,
+        agent_name, tone, voice, custom_greeting, custom_closing,
+        is_active, created_at, updated_at,
+    ) = row
+    
+    return {
+        "id": config_id,
+        "name": name,
+        "business": {
+            "name": business_name,
+            "industry": industry or Industry.OTHER.value,
+            "description": business_description,
+            "website": website,
+        },
+        "agent": {
+            "name": agent_name or "Alex",
+            "tone": tone or AgentTone.PROFESSIONAL.value,
+            "voice": voice or TTSVoice.NOVA.value,
+            "custom_greeting": custom_greeting,
+            "custom_closing": custom_closing,
+        },
+        "fields": [
+            {
+                # Field IDs aren't persisted; generated like FormField's default
+                "id": uuid.uuid4().hex[:8],
+                "name": f_name,
+                "label": label,
+                "type": f_type or FieldType.TEXT.value,
+                "description": description,
+                "required": bool(required),
+                "options": orjson.loads(options) if options else None,
+                "validation": None,
+                "example": example,
+                "order": order or 0,
+            }
+            for _, f_name, label, f_type, description, required, options, example, order in fields
+        ],
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "is_active": bool(is_active),
+    }
+
+
+def list_form_configs_raw(
+    active_only: bool = True,
+    limit: int = 50,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    List form configurations as plain dicts, for serializing straight to JSON.
+    
+    Loads all fields in one query instead of one per config, and skips
+    building FormConfig models. Dicts have the same shape as
+    ``FormConfig.model_dump(mode="json")`` without the usage counters.
+    
+    Args:
+        active_only: Only return active configs
+        limit: Maximum results
+        offset: Pagination offset
         
-        conn.close()
-        return configs
+    Returns:
+        List of form config dicts
+    """
+    try:
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            
+            query = SQL_LIST_ACTIVE if active_only else SQL_LIST_ALL
+            cursor.execute(query, (limit, offset))
+            rows = cursor.fetchall()
+            
+            fields_by_config = _fetch_fields_by_config(cursor, [row[0] for row in rows])
+            return [_row_to_form_dict(row, fields_by_config[row[0]]) for row in rows]
         
     except Exception as e:
-        logger.error(f"Failed to list form configs: {e}")
+        logger.error("Failed to list form configs: %s", e)
         return []
 
 
@@ -361,42 +591,70 @@ def delete_form_config(config_id: str) -> bool:
         True if successful
     """
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-        
-        # Delete fields first (foreign key)
-        cursor.execute("DELETE FROM form_fields WHERE form_config_id = ?", (config_id,))
-        
-        # Delete config
-        cursor.execute("DELETE FROM form_configs WHERE id = ?", (config_id,))
-        
-        conn.commit()
-        conn.close()
+        with get_conn() as conn, transaction(conn):
+            cursor = conn.cursor()
+            
+            # Delete fields first (foreign key)
+            cursor.execute(SQL_DELETE_FIELDS, (config_id,))
+            
+            # Delete config
+            cursor.execute(SQL_DELETE_CONFIG, (config_id,))
         
-        logger.info(f"Deleted form config: {config_id}")
+        _invalidate_loaded(config_id)
+        logger.info("Deleted form config: %s", config_id)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to delete form config: {e}")
+        logger.error("Failed to delete form config: %s", e)
         return False
 
 
 def count_form_configs(active_only: bool = True) -> int:
     """Count form configurations."""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        cursor = conn.cursor()
-        
-        query = "SELECT COUNT(*) FROM form_configs"
-        if active_only:
-            query += " WHERE is_active = 1"
-        
-        cursor.execute(query)
-        count = cursor.fetchone()[0]
-        
-        conn.close()
-        return count
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_COUNT_ACTIVE if active_only else SQL_COUNT_ALL)
+            count = cursor.fetchone()[0]
+            
+            return count
         
     except Exception as e:
-        logger.error(f"Failed to count form configs: {e}")
+        logger.error("Failed to count form configs: %s", e)
         return 0
+
+
+# =============================================================================
+# Async API
+# =============================================================================
+# sqlite3 calls block, so async callers use these, which run the functions
+# above in a worker thread and keep the event loop free.
+
+async def asave_form_config(config: FormConfig) -> bool:
+    """Async version of save_form_config."""
+    return await asyncio.to_thread(save_form_config, config)
+
+
+async def aload_form_config(config_id: str, use_cache: bool = True) -> Optional[FormConfig]:
+    """Async version of load_form_config."""
+    return await asyncio.to_thread(load_form_config, config_id, use_cache)
+
+
+async def aform_config_exists(config_id: str) -> bool:
+    """Async version of form_config_exists."""
+    return await asyncio.to_thread(form_config_exists, config_id)
+
+
+async def alist_form_configs_raw(
+    active_only: bool = True,
+    limit: int = 50,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """Async version of list_form_configs_raw."""
+    return await asyncio.to_thread(list_form_configs_raw, active_only, limit, offset)
+
+
+async def adelete_form_config(config_id: str) -> bool:
+    """Async version of delete_form_config."""
+    return await asyncio.to_thread(delete_form_config, config_id)
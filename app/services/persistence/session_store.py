@@ -0,0 +1,126 @@
+"""
+Chat Session Storage
+
+Stores live chat session state (history, payload, form id) by thread ID.
+Uses Redis when REDIS_URL is configured so session state is shared
+between workers, and falls back to an in-process store otherwise.
+
+The agents' LangGraph memory is still per process, so multi-worker
+deployments must keep routing each thread to the same worker.
+"""
+
+import logging
+import threading
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for session hashes
+SESSION_KEY_PREFIX = "session:"
+
+
+class SessionStore:
+    """
+    In-process session store.
+
+    Sessions live in a TTL cache, so they are lost on restart and are not
+    shared between workers. Idle sessions expire after the session
+    timeout, and the least recently used are evicted beyond max_sessions.
+    """
+
+    def __init__(self, ttl_seconds: int, max_sessions: int):
+        self._sessions: TTLCache = TTLCache(maxsize=max_sessions, ttl=ttl_seconds)
+        # TTLCache isn't thread-safe; sessions may be touched from worker threads
+        self._lock = threading.Lock()
+
+    async def get(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session by thread ID, or None if it doesn't exist."""
+        with self._lock:
+            return self._sessions.get(thread_id)
+
+    async def set(self, thread_id: str, session: Dict[str, Any]) -> None:
+        """Create or replace a session, refreshing its TTL."""
+        with self._lock:
+            self._sessions[thread_id] = session
+
+    async def delete(self, thread_id: str) -> bool:
+        """Delete a session. Returns True if it existed."""
+        with self._lock:
+            return self._sessions.pop(thread_id, None) is not None
+
+    async def page(self, limit: int, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of sessions along with the total session count."""
+        with self._lock:
+            sessions = list(islice(self._sessions.values(), offset, offset + limit))
+            return sessions, len(self._sessions)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis-backed session store.
+
+    Each session is stored as orjson under ``session:{thread_id}`` and
+    expires after the configured session timeout of inactivity.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int):
+        # Imported lazily so redis is only required when configured
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._ttl = ttl_seconds
+
+    async def get(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session by thread ID, or None if it doesn't exist."""
+        raw = await self._redis.get(SESSION_KEY_PREFIX + thread_id)
+        return orjson.loads(raw) if raw else None
+
+    async def set(self, thread_id: str, session: Dict[str, Any]) -> None:
+        """Create or replace a session, refreshing its TTL."""
+        await self._redis.setex(SESSION_KEY_PREFIX + thread_id, self._ttl, orjson.dumps(session))
+
+    async def delete(self, thread_id: str) -> bool:
+        """Delete a session. Returns True if it existed."""
+        return await self._redis.delete(SESSION_KEY_PREFIX + thread_id) > 0
+
+    async def _keys(self) -> List[bytes]:
+        """Get all session keys using SCAN, so Redis is never blocked."""
+        return [key async for key in self._redis.scan_iter(match=SESSION_KEY_PREFIX + "*")]
+
+    async def page(self, limit: int, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of sessions along with the total session count, from a single SCAN."""
+        keys = await self._keys()
+        page_keys = keys[offset:offset + limit]
+        if not page_keys:
+            return [], len(keys)
+        sessions = [orjson.loads(raw) for raw in await self._redis.mget(page_keys) if raw]
+        return sessions, len(keys)
+
+
+# Singleton instance
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Get or create the session store singleton."""
+    global _session_store
+    if _session_store is None:
+        if settings.redis_url:
+            _session_store = RedisSessionStore(
+                settings.redis_url,
+                ttl_seconds=settings.session_timeout_minutes * 60,
+            )
+            logger.info("Using Redis session store")
+        else:
+            _session_store = SessionStore(
+                ttl_seconds=settings.session_timeout_minutes * 60,
+                max_sessions=settings.max_sessions,
+            )
+            logger.info("Using in-memory session store")
+    return _session_store
@@ -0,0 +1,124 @@
+"""
+Next Turn Prefetch
+
+While the user is listening to the agent's question, predicts their most
+likely reply and pre-renders the agent's response (text and TTS audio).
+If the actual reply is close enough to the prediction, the response is
+served immediately and only extraction runs on the real reply.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.services.semantic_cache import get_semantic_cache
+from app.services.voice import synthesize_speech_base64
+
+logger = logging.getLogger(__name__)
+
+# Seconds a prediction stays usable after it is made
+PREFETCH_TTL_SECONDS = 300
+
+
+@dataclass
+class PrefetchedTurn:
+    """A predicted turn, pre-rendered ahead of the user's reply."""
+    context: str  # the agent message the prediction is a reply to
+    reply_vector: np.ndarray
+    response: str
+    audio_data: Optional[str] = None  # base64 encoded TTS response
+
+
+class PrefetchCache:
+    """
+    Per-thread store of predicted next turns.
+
+    Holds at most one prediction per thread, and only matches it against
+    replies to the same agent message it was made for.
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = threshold if threshold is not None else settings.semantic_cache_threshold
+        self._turns: TTLCache = TTLCache(maxsize=settings.max_sessions, ttl=PREFETCH_TTL_SECONDS)
+
+    async def prefetch(self, agent, thread_id: str, context: str) -> None:
+        """
+        Predict and pre-render the next turn for a thread.
+
+        Args:
+            agent: DynamicAgent serving the thread
+            thread_id: Conversation thread ID
+            context: The agent message the user will reply to
+        """
+        self._turns.pop(thread_id, None)
+
+        predicted = await agent.predict_next_turn(thread_id)
+        if not predicted or not predicted.response:
+            return
+
+        try:
+            vector = await get_semantic_cache().embed(predicted.reply)
+        except Exception as e:
+            logger.warning(f"Prefetch embedding failed: {e}")
+            return
+
+        try:
+            audio_data = await synthesize_speech_base64(predicted.response)
+        except Exception as e:
+            logger.warning(f"Prefetch TTS failed: {e}")
+            audio_data = None
+
+        self._turns[thread_id] = PrefetchedTurn(context, vector, predicted.response, audio_data)
+        logger.debug(f"Prefetched next turn for {thread_id}: {predicted.reply!r}")
+
+    async def lookup(self, thread_id: str, context: str, message: str) -> Optional[PrefetchedTurn]:
+        """
+        Take the prefetched turn for a thread if the user's reply matches it.
+
+        The prediction is consumed either way, since the conversation has
+        moved past it.
+
+        Args:
+            thread_id: Conversation thread ID
+            context: The agent message the user is replying to
+            message: User message text
+
+        Returns:
+            PrefetchedTurn on a hit, otherwise None
+        """
+        turn = self._turns.pop(thread_id, None)
+        if turn is None or turn.context != context:
+            return None
+
+        try:
+            query = await get_semantic_cache().embed(message)
+        except Exception as e:
+            logger.warning(f"Prefetch embedding failed: {e}")
+            return None
+
+        score = float(turn.reply_vector @ query)
+        if score < self.threshold:
+            return None
+
+        logger.debug(f"Prefetch hit for {thread_id} (score={score:.3f})")
+        return turn
+
+    def discard(self, thread_id: str) -> None:
+        """Drop any prefetched turn for a thread."""
+        self._turns.pop(thread_id, None)
+
+
+# Singleton instance
+_prefetch_cache: Optional[PrefetchCache] = None
+
+
+def get_prefetch_cache() -> PrefetchCache:
+    """Get or create the prefetch cache singleton."""
+    global _prefetch_cache
+    if _prefetch_cache is None:
+        _prefetch_cache = PrefetchCache()
+    return _prefetch_cache
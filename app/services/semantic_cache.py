@@ -0,0 +1,227 @@
+"""
+Semantic Response Cache
+
+Caches agent responses for near-identical user replies to the same
+agent question (e.g. "yes", "that's correct", "can you repeat that").
+A hit skips the LLM and TTS round trips entirely.
+"""
+
+import hashlib
+import logging
+import string
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple, Deque
+
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from langchain_openai import OpenAIEmbeddings
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Max cached responses per (form_id, agent question, payload) key
+MAX_ENTRIES_PER_KEY = 64
+
+# Max cached responses in total; least recently used keys are evicted first
+MAX_ENTRIES = 4096
+
+# Replies that carry no form data (after normalize_message): confirmations,
+# acknowledgements and requests to repeat. Only these are cached, because a
+# cached response is replayed without running extraction on the reply.
+CONTENT_FREE_REPLIES = frozenset({
+    "yes", "yeah", "yep", "yup", "sure", "correct", "right", "exactly",
+    "thats right", "thats correct", "yes thats right", "yes thats correct",
+    "ok", "okay", "alright", "all right", "got it", "i see", "sounds good",
+    "great", "perfect", "thanks", "thank you", "thanks a lot", "thank you so much",
+    "hello", "hi", "sorry", "pardon", "what",
+    "can you repeat that", "could you repeat that", "repeat that please",
+    "please repeat that", "say that again",
+})
+
+
+@dataclass
+class CachedResponse:
+    """A cached agent turn."""
+    response: str
+    audio_data: Optional[str] = None  # base64 encoded TTS response
+
+
+# Punctuation stripped before embedding: apostrophes are dropped so
+# "don't" stays one word, everything else becomes a word break.
+# Includes common Spanish, French and CJK punctuation.
+_NORMALIZE_TABLE = str.maketrans({
+    **dict.fromkeys(string.punctuation + "¿¡«»“”‘’…。、，！？：；「」『』（）", " "),
+    "'": None,
+    "’": None,
+})
+
+
+def normalize_message(text: str) -> str:
+    """Normalize a user message for embedding."""
+    return " ".join(text.lower().translate(_NORMALIZE_TABLE).split())
+
+
+def is_content_free(message: str) -> bool:
+    """Whether a user message is a reply that carries no form data."""
+    return normalize_message(message) in CONTENT_FREE_REPLIES
+
+
+def payload_digest(payload: Dict[str, Any]) -> str:
+    """Digest of a session's collected payload, independent of key order."""
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+
+
+class SemanticCache:
+    """
+    Embedding-based response cache.
+
+    Only content-free replies (see CONTENT_FREE_REPLIES) are cached or
+    looked up. Entries are bucketed by (form_id, previous agent message,
+    payload digest), so a reply is only matched against replies to the
+    same question on the same form, from a session that had collected the
+    same values. Within a bucket, the closest entry by cosine similarity
+    is returned if it clears the threshold. Entries expire after the
+    cache TTL.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, ttl_seconds: Optional[int] = None):
+        self.threshold = threshold if threshold is not None else settings.semantic_cache_threshold
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.cache_ttl
+        self._embeddings: Optional[OpenAIEmbeddings] = None
+        # Keys are sized by their number of entries, so MAX_ENTRIES bounds
+        # the total; idle keys expire with the TTL
+        self._entries: TTLCache = TTLCache(
+            maxsize=MAX_ENTRIES, ttl=self.ttl_seconds, getsizeof=len
+        )
+
+    @property
+    def embeddings(self) -> OpenAIEmbeddings:
+        """Get or create the embeddings client."""
+        if self._embeddings is None:
+            self._embeddings = OpenAIEmbeddings(
+                model=settings.embedding_model,
+                api_key=settings.openai_api_key,
+            )
+        return self._embeddings
+
+    async def embed(self, message: str) -> np.ndarray:
+        """Embed a message as a unit vector."""
+        vector = np.asarray(
+            await self.embeddings.aembed_query(normalize_message(message)),
+            dtype=np.float32,
+        )
+        return vector / np.linalg.norm(vector)
+
+    async def lookup(
+        self,
+        form_id: str,
+        context: str,
+        payload: Dict[str, Any],
+        message: str,
+    ) -> Optional[CachedResponse]:
+        """
+        Find a cached response for a user message.
+
+        Messages that aren't content-free always miss, without embedding.
+
+        Args:
+            form_id: Form configuration ID
+            context: The agent message the user is replying to
+            payload: The session's collected payload
+            message: User message text
+
+        Returns:
+            CachedResponse on a hit, otherwise None
+        """
+        if not is_content_free(message):
+            return None
+
+        bucket = self._entries.get((form_id, context, payload_digest(payload)))
+        now = time.monotonic()
+        live = [(vector, cached) for vector, cached, expires in bucket or () if expires > now]
+        if not live:
+            return None
+
+        try:
+            query = await self.embed(message)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+        vectors = np.stack([vector for vector, _ in live])
+        scores = vectors @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit for form {form_id} (score={scores[best]:.3f})")
+        return live[best][1]
+
+    async def store(
+        self,
+        form_id: str,
+        context: str,
+        payload: Dict[str, Any],
+        message: str,
+        response: CachedResponse,
+    ) -> None:
+        """
+        Cache a response for a user message.
+
+        Messages that aren't content-free are not cached.
+
+        Args:
+            form_id: Form configuration ID
+            context: The agent message the user is replying to
+            payload: The session's collected payload
+            message: User message text
+            response: Response to cache
+        """
+        if not is_content_free(message):
+            return
+
+        try:
+            vector = await self.embed(message)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return
+
+        key = (form_id, context, payload_digest(payload))
+        bucket: Deque[Tuple[np.ndarray, CachedResponse, float]] = self._entries.get(
+            key, deque(maxlen=MAX_ENTRIES_PER_KEY)
+        )
+        bucket.append((vector, response, time.monotonic() + self.ttl_seconds))
+        # Re-set so the cache accounts for the bucket's new size
+        self._entries[key] = bucket
+
+    def clear(self, form_id: Optional[str] = None) -> None:
+        """
+        Clear cached responses.
+
+        Args:
+            form_id: Specific form to clear, or None to clear all
+        """
+        if form_id:
+            for key in [key for key in self._entries if key[0] == form_id]:
+                del self._entries[key]
+        else:
+            self._entries.clear()
+
+
+# Singleton instance
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the semantic cache singleton."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
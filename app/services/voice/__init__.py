@@ -1,4 +1,20 @@
 """Voice Services - Speech-to-Text and Text-to-Speech."""
-from .openai_voice import OpenAIVoice, transcribe_audio, synthesize_speech
+from .openai_voice import (
+    OpenAIVoice,
+    transcribe_audio,
+    synthesize_speech,
+    synthesize_speech_base64,
+    set_http_client,
+    encode_audio_base64,
+    decode_audio_base64,
+)
 
-__all__ = ["OpenAIVoice", "transcribe_audio", "synthesize_speech"]
+__all__ = [
+    "OpenAIVoice",
+    "transcribe_audio",
+    "synthesize_speech",
+    "synthesize_speech_base64",
+    "set_http_client",
+    "encode_audio_base64",
+    "decode_audio_base64",
+]
@@ -5,17 +5,25 @@ Provides Speech-to-Text (Whisper) and Text-to-Speech capabilities
 using OpenAI's audio APIs.
 """
 
+import asyncio
 import logging
 import io
+import hashlib
+from collections import OrderedDict
 from typing import Optional, BinaryIO, Union
 from pathlib import Path
 
+import httpx
+import pybase64
 from openai import OpenAI, AsyncOpenAI
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared pooled HTTP client for async OpenAI calls, set at app startup
+_http_client: Optional[httpx.AsyncClient] = None
+
 
 class OpenAIVoice:
     """
@@ -33,6 +41,7 @@ class OpenAIVoice:
         tts_model: Optional[str] = None,
         tts_voice: Optional[str] = None,
         tts_speed: Optional[float] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize OpenAI Voice service.
@@ -43,12 +52,15 @@ class OpenAIVoice:
             tts_model: TTS model (default: tts-1)
             tts_voice: TTS voice (default: alloy)
             tts_speed: TTS speed multiplier (default: 1.0)
+            http_client: HTTP client for async calls (default: the shared
+                client set by set_http_client, if any)
         """
         self.api_key = api_key or settings.openai_api_key
         self.whisper_model = whisper_model or settings.whisper_model
         self.tts_model = tts_model or settings.tts_model
         self.tts_voice = tts_voice or settings.tts_voice
         self.tts_speed = tts_speed if tts_speed is not None else settings.tts_speed
+        self.http_client = http_client
         
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
@@ -67,7 +79,10 @@ class OpenAIVoice:
     def async_client(self) -> AsyncOpenAI:
         """Get or create asynchronous OpenAI client."""
         if self._async_client is None:
-            self._async_client = AsyncOpenAI(api_key=self.api_key)
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self.http_client or _http_client,
+            )
         return self._async_client
     
     def transcribe(
@@ -270,6 +285,20 @@ def get_voice_service() -> OpenAIVoice:
     return _voice_service
 
 
+def set_http_client(client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Set the shared HTTP client used for async OpenAI voice calls.
+    
+    Reusing one pooled client keeps connections (and TLS sessions) alive
+    across requests instead of reconnecting per call.
+    """
+    global _http_client
+    _http_client = client
+    if _voice_service is not None:
+        # Rebuild the async client on next use so it picks up the new pool
+        _voice_service._async_client = None
+
+
 async def transcribe_audio(
     audio_data: bytes,
     language: Optional[str] = None,
@@ -304,3 +333,65 @@ async def synthesize_speech(
     """
     service = get_voice_service()
     return await service.synthesize_async(text, voice=voice)
+
+
+# TTS cache - base64 audio keyed by sha256 of voice and text
+_tts_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Max cached TTS clips (LRU eviction beyond this)
+TTS_CACHE_MAX_ENTRIES = 512
+
+# Audio larger than this is base64 encoded/decoded in a worker thread
+# so it doesn't block the event loop
+BASE64_OFFLOAD_BYTES = 64 * 1024
+
+
+async def encode_audio_base64(audio: bytes) -> str:
+    """Base64 encode audio, off the event loop for large clips."""
+    if len(audio) > BASE64_OFFLOAD_BYTES:
+        encoded = await asyncio.to_thread(pybase64.b64encode, audio)
+    else:
+        encoded = pybase64.b64encode(audio)
+    return encoded.decode()
+
+
+async def decode_audio_base64(data: str) -> bytes:
+    """Decode base64 audio, off the event loop for large payloads."""
+    if len(data) > BASE64_OFFLOAD_BYTES:
+        return await asyncio.to_thread(pybase64.b64decode, data)
+    return pybase64.b64decode(data)
+
+
+async def synthesize_speech_base64(
+    text: str,
+    voice: Optional[str] = None,
+) -> str:
+    """
+    Synthesize speech and return it base64 encoded, with caching.
+    
+    Repeated phrases (greetings, confirmations) are served from an
+    in-process LRU cache of the encoded audio, skipping both the TTS
+    call and the re-encode.
+    
+    Args:
+        text: Text to synthesize
+        voice: Voice to use (optional)
+        
+    Returns:
+        Base64 encoded audio
+    """
+    if not settings.enable_caching:
+        return await encode_audio_base64(await synthesize_speech(text, voice=voice))
+    
+    key = hashlib.sha256(f"{voice or settings.tts_voice}:{text}".encode()).hexdigest()
+    cached = _tts_cache.get(key)
+    if cached is not None:
+        _tts_cache.move_to_end(key)
+        return cached
+    
+    audio_data = await encode_audio_base64(await synthesize_speech(text, voice=voice))
+    _tts_cache[key] = audio_data
+    if len(_tts_cache) > TTS_CACHE_MAX_ENTRIES:
+        _tts_cache.popitem(last=False)
+    
+    return audio_data